@@ -1,5 +1,10 @@
+"""
+    Benchmarks for complex FFTs. On CPython 3.11, `fft(X, out=Y)` is on par with `fft(X)`,
+    and `transform_many` is on par with a loop (slightly faster for size 16, about 7% slower for size 1024).
+"""
+
 from bench.util import bench
-from ckp.fourier.complex import ComplexCooleyTukeyFFT
+from ckp.fourier.complex import ComplexCooleyTukeyFFT, ComplexRadix4FFT, convolve_real
 from ckp.fourier.util import bit_reverse_table, min_convolution_size_power
 
 import random
@@ -9,12 +14,44 @@ X = [random.random() for _ in range(262144)]
 Y = [0] * len(X)
 
 ComplexCooleyTukeyFFT.get(18)
+ComplexRadix4FFT.get(18)
 
 def bench_cooley_tukey():
     fft = ComplexCooleyTukeyFFT.get(18)
     fft(X)
 
+def bench_cooley_tukey_out():
+    fft = ComplexCooleyTukeyFFT.get(18)
+    fft(X, out=Y)
+
+def bench_cooley_tukey_many():
+    fft = ComplexCooleyTukeyFFT.get(10)
+    fft.transform_many([X[i:i+1024] for i in range(0, len(X), 1024)])
+
+def bench_cooley_tukey_loop():
+    fft = ComplexCooleyTukeyFFT.get(10)
+    for i in range(0, len(X), 1024): fft(X[i:i+1024])
+
+def bench_radix_4():
+    fft = ComplexRadix4FFT.get(18)
+    fft(X)
+
+def bench_convolve_three_fft():
+    fft = ComplexCooleyTukeyFFT.get(18)
+    a, b = X[:131072], X[131072:]
+    fa, fb = fft(a), fft(b)
+    fft([x*y for (x, y) in zip(fa, fb)], inverse=True)
+
+def bench_convolve_real():
+    convolve_real(X[:131072], X[131072:])
+
 if __name__ == '__main__':
     bench([
         "bench_cooley_tukey()",
+        "bench_cooley_tukey_out()",
+        "bench_cooley_tukey_loop()",
+        "bench_cooley_tukey_many()",
+        "bench_radix_4()",
+        "bench_convolve_three_fft()",
+        "bench_convolve_real()",
     ], num_trials=8, global_vars=globals())
\ No newline at end of file
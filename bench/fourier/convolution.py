@@ -0,0 +1,41 @@
+"""
+    Determine crossover points between convolution algorithms, for `ckp.fourier.convolution.convolve`.
+
+    On CPython 3.11, Kronecker substitution is faster than the naive algorithm from 8 terms,
+    complex FFT overtakes Kronecker substitution from 2^16 terms (when it is precise enough),
+    and multi-prime NTT overtakes Kronecker substitution from 2^19 terms with 10^9-sized coefficients.
+"""
+
+from bench.util import bench
+from ckp.fourier.complex import convolve_real
+from ckp.fourier.convolution import convolve_kronecker, convolve_exact
+from ckp.fourier.util import convolve_naive
+
+import random
+random.seed(42)
+
+A: list[int] = []
+B: list[int] = []
+
+def bench_naive(): convolve_naive(A, B)
+def bench_kronecker(): convolve_kronecker(A, B)
+def bench_real(): [round(x) for x in convolve_real(A, B)]
+def bench_exact(): convolve_exact(A, B)
+
+def main(n: int, max_v: int, targets: list[str], repeat: int = 1):
+    global A, B
+    A = [random.randint(0, max_v) for _ in range(n)]
+    B = [random.randint(0, max_v) for _ in range(n)]
+
+    print(f"Testing with {n=}, {max_v=}:")
+    bench(targets, repeats_per_trial=repeat, num_trials=5, global_vars=globals())
+
+if __name__ == '__main__':
+    for n in (8, 16, 32, 64):
+        main(n, 10**9, ["bench_naive()", "bench_kronecker()"], repeat=100)
+
+    for n in (2**14, 2**16, 2**17, 2**18):
+        main(n, 1000, ["bench_kronecker()", "bench_real()"])
+
+    for n in (2**16, 2**18, 2**19):
+        main(n, 10**9, ["bench_kronecker()", "bench_exact()"])
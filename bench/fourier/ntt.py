@@ -0,0 +1,40 @@
+"""
+    Benchmarks for NTT. `transform_many` packs inputs into one buffer, so that short butterfly stages are shared by all inputs;
+    on CPython 3.11, it is about 2.3x faster than a loop for 16384 transforms of size 16, and on par for 256 transforms of size 1024.
+"""
+
+from bench.util import bench
+from ckp.fourier.ntt import NTT, convolve_ntt
+
+import random
+random.seed(42)
+
+P = 998244353
+X = [random.randrange(P) for _ in range(262144)]
+
+NTT.get(18)
+
+def bench_ntt():
+    ntt = NTT.get(18)
+    ntt(X)
+
+def bench_convolve_ntt():
+    convolve_ntt(X[:131072], X[131072:])
+
+def bench_ntt_loop(L:int):
+    ntt = NTT.get(L)
+    for i in range(0, len(X), 1<<L): ntt(X[i:i+(1<<L)])
+
+def bench_ntt_many(L:int):
+    ntt = NTT.get(L)
+    ntt.transform_many([X[i:i+(1<<L)] for i in range(0, len(X), 1<<L)])
+
+if __name__ == '__main__':
+    bench([
+        "bench_ntt()",
+        "bench_convolve_ntt()",
+    ], num_trials=8, global_vars=globals())
+
+    for L in (4, 10):
+        print(f"Transforming {len(X) >> L} inputs of size {1<<L}:")
+        bench([f"bench_ntt_loop({L})", f"bench_ntt_many({L})"], num_trials=8, global_vars=globals())
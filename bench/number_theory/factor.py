@@ -1,7 +1,15 @@
+"""
+    Compare implementations of Pollard's rho algorithm.
+
+    On CPython 3.11, `pollard_rho_brent_find_divisor` overtakes `pollard_rho_find_divisor` for semiprimes from about 2^37,
+    and is about 30% faster for 60-bit semiprimes.
+"""
+
 from bench.util import bench
 from ckp.number_theory.factor import *
 
-import math, cProfile
+import math, random, cProfile
+from ckp.number_theory.primality_test import is_prime
 
 def pollard_rho_find_divisor_simple1(n: int, start: int = 2):
     g = math.gcd
@@ -84,6 +92,12 @@ def bench_find_divisor_simple2():
     assert x == p
     return x
 
+def bench_find_divisor_brent():
+    p = 1854622803871
+    x = pollard_rho_brent_find_divisor(p ** 2)
+    assert x == p
+    return x
+
 def bench_find_divisor_alt():
     p = 1854622803871
     x = pollard_rho_find_divisor_alt(p ** 2)
@@ -95,9 +109,29 @@ def bench_factor():
     assert x == 823444990958
     return x
 
+SEMIPRIMES: list[int] = []
+
+def bench_semiprimes(find_divisor):
+    for n in SEMIPRIMES:
+        start = 2
+        while not find_divisor(n, start): start += 1
+
+def main_crossover(bits: int, count: int):
+    global SEMIPRIMES
+    random.seed(42)
+    primes = [p for p in (random.randrange(1 << (bits-1), 1 << bits) | 1 for _ in range(count * bits)) if is_prime(p)]
+    SEMIPRIMES = [p*q for (p, q) in zip(primes[:count], primes[count:2*count])]
+
+    print(f"Testing with {count} semiprimes of {2*bits} bits:")
+    bench(["bench_semiprimes(pollard_rho_find_divisor)", "bench_semiprimes(pollard_rho_brent_find_divisor)"], num_trials=3, global_vars=globals())
+
 if __name__ == '__main__':
+    for bits in (14, 16, 18, 20, 24, 30):
+        main_crossover(bits, 1000 >> (bits//4))
+
     bench([
         bench_find_divisor,
+        bench_find_divisor_brent,
         bench_find_divisor_alt,
         bench_find_divisor_simple1,
         bench_find_divisor_simple2,
@@ -0,0 +1,28 @@
+"""
+    Compare `is_prime_many` against calling `is_prime` for each number.
+
+    On CPython 3.11, `is_prime_many` is about 1.5x faster for random 64-bit numbers, thanks to the 7-base Miller-Rabin test below 2^64,
+    and about 1.2x faster for random 32-bit numbers or consecutive numbers from 10^18. `pow` dominates the remaining running time.
+"""
+
+import random
+
+from bench.util import bench
+from ckp.number_theory.primality_test import is_prime, is_prime_many
+
+NS: list[int] = []
+
+def bench_is_prime(): return [is_prime(n) for n in NS]
+def bench_is_prime_many(): return is_prime_many(NS)
+
+def main(name: str, ns: list[int]):
+    global NS
+    NS = ns
+    print(f"Testing with {name} ({len(ns)} numbers):")
+    bench(["bench_is_prime()", "bench_is_prime_many()"], num_trials=3, global_vars=globals())
+
+if __name__ == '__main__':
+    random.seed(42)
+    main("random 32-bit numbers", [random.getrandbits(32) for _ in range(100_000)])
+    main("random odd 64-bit numbers", [random.getrandbits(64)|1 for _ in range(100_000)])
+    main("consecutive numbers from 10^18", list(range(10**18, 10**18 + 100_000)))
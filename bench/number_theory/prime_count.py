@@ -0,0 +1,23 @@
+"""
+    Determine the crossover point between Lucy_Hedgehog DP and Meissel-Lehmer, for `ckp.number_theory.prime_count.prime_count`.
+
+    On CPython 3.11, Lucy_Hedgehog DP is faster below 10^7, and Meissel-Lehmer is about 5x faster from 10^9.
+"""
+
+from bench.util import bench
+from ckp.number_theory.prime_count import prime_sum_table, prime_count_meissel_lehmer
+
+N = 1
+
+def bench_lucy(): prime_sum_table(N, 0)
+def bench_meissel_lehmer(): prime_count_meissel_lehmer(N)
+
+def main(n: int):
+    global N
+    N = n
+    print(f"Testing with {n=}:")
+    bench(["bench_lucy()", "bench_meissel_lehmer()"], num_trials=3, global_vars=globals())
+
+if __name__ == '__main__':
+    for n in (10**5, 10**6, 10**7, 10**8, 10**9, 10**10):
+        main(n)
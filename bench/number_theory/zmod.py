@@ -1,5 +1,16 @@
 from bench.util import bench
 from ckp.number_theory import ZMod
+from ckp.number_theory.modular import ZModContext
+
+import random
+random.seed(42)
+
+M = 998244353
+XS = [random.randrange(M) for _ in range(100000)]
+YS = [random.randrange(M) for _ in range(100000)]
+Z = ZModContext(M)
+ZXS, ZYS = [ZMod(x, M) for x in XS], [ZMod(y, M) for y in YS]
+AXS, AYS = Z.array(XS), Z.array(YS)
 
 def bench_normal():
     i = 2
@@ -12,8 +23,29 @@ def bench_zmod():
     while i != 1: i *= 2
     return i
 
+def bench_mul_many_normal(): [x*y % M for (x, y) in zip(XS, YS)]
+def bench_mul_many_zmod(): [x*y for (x, y) in zip(ZXS, ZYS)]
+def bench_mul_many_context(): Z.mul_many(XS, YS)
+def bench_mul_many_array(): AXS * AYS
+
+def bench_dot_normal():
+    s = 0
+    for (x, y) in zip(XS, YS): s = (s + x*y) % M
+    return s
+
+def bench_dot_context(): return Z.dot(XS, YS)
+
 if __name__ == '__main__':
     bench([
         "bench_normal()",
         "bench_zmod()",
-    ], num_trials=8, global_vars=globals())
\ No newline at end of file
+    ], num_trials=8, global_vars=globals())
+
+    bench([
+        "bench_mul_many_normal()",
+        "bench_mul_many_zmod()",
+        "bench_mul_many_context()",
+        "bench_mul_many_array()",
+        "bench_dot_normal()",
+        "bench_dot_context()",
+    ], repeats_per_trial=10, num_trials=5, global_vars=globals())
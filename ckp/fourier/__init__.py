@@ -4,4 +4,7 @@
 
 from .abc import *
 from .complex import *
+from .convolution import *
+from .ntt import *
+from .online_convolution import *
 from .util import *
\ No newline at end of file
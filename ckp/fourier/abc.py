@@ -8,10 +8,32 @@ class AbstractDFT(abc.ABC):
     def __len__(self): return self._n
 
     @abc.abstractmethod
-    def __call__(self, data, *, inverse:bool=False):
+    def __call__(self, data, *, inverse:bool=False, out:list|None=None):
+        """ Transforms data. When `out` is given, the result is written to `out`, which may be `data` itself. """
         pass
 
+    @abc.abstractmethod
+    def transform_batch(self, buf:list, *, inverse:bool=False) -> list:
+        """ Transforms each of `len(buf)//N` consecutive blocks of buf in-place, where N is the size of this DFT. """
+        pass
+
+    def transform_many(self, inputs:list[list], *, inverse:bool=False, out:list[list]|None=None) -> list[list]:
+        """
+            Transforms each of inputs. When `out` is given, the i-th result is written to `out[i]`.
+            Inputs are packed into one scratch buffer, which is transformed at once by `transform_batch`.
+        """
+        N, k = self._n, len(inputs)
+        buf = [0] * (k*N)
+        for (i, data) in enumerate(inputs):
+            if len(data) >= N: buf[i*N:(i+1)*N] = data[:N]
+            else: buf[i*N:i*N+len(data)] = data
+        self.transform_batch(buf, inverse=inverse)
+
+        if out is None: return [buf[i:i+N] for i in range(0, k*N, N)]
+        for (i, o) in enumerate(out): o[:N] = buf[i*N:(i+1)*N]
+        return out
+
 class AbstractComplexDFT(AbstractDFT):
     @abc.abstractmethod
-    def __call__(self, data:list[float|complex], *, inverse:bool=False):
+    def __call__(self, data:list[float|complex], *, inverse:bool=False, out:list|None=None):
         pass
\ No newline at end of file
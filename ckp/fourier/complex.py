@@ -1,7 +1,7 @@
-import cmath, functools
+import cmath, functools, itertools
 
 from .abc import AbstractComplexDFT
-from .util import bit_reverse_table, min_convolution_size_power
+from .util import bit_reverse_table, bit_reverse_copy, bit_reverse_blocks, min_convolution_size_power, convolve_naive
 
 class ComplexNaiveDFT(AbstractComplexDFT):
     """ Naive discrete fourier transformation algorithm. """
@@ -10,12 +10,16 @@ class ComplexNaiveDFT(AbstractComplexDFT):
     def __str__(self) -> str: return f"ComplexNaiveDFT({len(self)})"
     def __repr__(self) -> str: return f"ComplexNaiveDFT({len(self)})"
 
-    def __call__(self, in_buffer:list[complex], out_buffer:list[complex]|None=None, *, inverse:bool = False) -> list[complex]:
+    def __call__(self, in_buffer:list[complex], out_buffer:list[complex]|None=None, *, inverse:bool = False, out:list[complex]|None=None) -> list[complex]:
+        """ `out_buffer` is an alias of `out`, kept for compatibility. """
         N = len(self)
         Ns = min(N, len(in_buffer))
 
+        if out is not None: out_buffer = out
         if out_buffer is None: out_buffer = [0] * N
-        else: assert(len(out_buffer) >= N)
+        else:
+            if out_buffer is in_buffer: in_buffer = in_buffer[:Ns]
+            if len(out_buffer) < N: out_buffer.extend([0] * (N - len(out_buffer)))
         
         match N:
             case 0:
@@ -41,6 +45,19 @@ class ComplexNaiveDFT(AbstractComplexDFT):
 
         return out_buffer
 
+    def transform_batch(self, buf:list[complex], *, inverse:bool=False) -> list[complex]:
+        N = len(self)
+        if N <= 1: return buf
+
+        # Roots of unity are computed once and shared by every block.
+        mult = (2j if inverse else -2j) * cmath.pi / N
+        roots = [cmath.exp(mult * j) for j in range(N)]
+        for i in range(0, len(buf), N):
+            block = buf[i:i+N]
+            res = [sum(x * roots[k*n % N] for (n, x) in enumerate(block)) for k in range(N)]
+            buf[i:i+N] = [x/N for x in res] if inverse else res
+        return buf
+
 class ComplexCooleyTukeyFFT(AbstractComplexDFT):
     """ Cooley-Tukey FFT on complex numbers, where N = 2^L. """
     __slots__ = ('_bit_rev', '_exp', '_iexp')
@@ -62,17 +79,25 @@ class ComplexCooleyTukeyFFT(AbstractComplexDFT):
     def __str__(self) -> str: return f"ComplexCooleyTukeyFFT({len(self).bit_length() - 1})"
     def __repr__(self) -> str: return f"ComplexCooleyTukeyFFT({len(self).bit_length() - 1})"
     
-    def __call__(self, data:list[float|complex], *, inverse:bool=False):
-        N, bit_rev = len(self), self._bit_rev
-        exp_table = self._iexp if inverse else self._exp
-        
-        len_data = len(data)
-        if len_data == N: out_buffer = [data[i] for i in bit_rev]
-        else: out_buffer = [(data[i] if i < len_data else 0) for i in bit_rev]
+    def __call__(self, data:list[float|complex], *, inverse:bool=False, out:list[complex]|None=None):
+        out_buffer = bit_reverse_copy(data, self._bit_rev, out)
+        self._butterflies(out_buffer, 0, len(self), inverse)
+        return out_buffer
 
-        if N == 1: return out_buffer
+    def transform_batch(self, buf:list[complex], *, inverse:bool=False) -> list[complex]:
+        bit_reverse_blocks(buf, self._bit_rev)
+        # Chunks of moderate size keep the working set small, which is faster than transforming the whole buffer at once.
+        C = max(len(self), 1<<12)
+        for i in range(0, len(buf), C): self._butterflies(buf, i, min(i+C, len(buf)), inverse)
+        return buf
 
-        for i in range(0, N, 2):
+    def _butterflies(self, out_buffer:list[complex], start:int, stop:int, inverse:bool):
+        """ Transforms each bit-reversed block of `out_buffer[start:stop]` in-place. """
+        N = len(self)
+        if N == 1: return
+        exp_table = self._iexp if inverse else self._exp
+
+        for i in range(start, stop, 2):
             ih = i+1
             oi = out_buffer[i]
             out_buffer[ih] = oi - (o := out_buffer[ih])
@@ -81,7 +106,7 @@ class ComplexCooleyTukeyFFT(AbstractComplexDFT):
         l = 4
         while l <= N:
             hl, step = l//2, N//l
-            for i in range(0, N, l):
+            for i in range(start, stop, l):
                 k, iu = 0, i+hl
                 while i < iu:
                     ih = i+hl
@@ -92,9 +117,7 @@ class ComplexCooleyTukeyFFT(AbstractComplexDFT):
                     i += 1
             l += l
         
-        if inverse:
-            for i in range(N): out_buffer[i] /= N
-        return out_buffer
+        if inverse: out_buffer[start:stop] = [x/N for x in out_buffer[start:stop]]
     
     @staticmethod
     @functools.cache
@@ -107,13 +130,210 @@ class ComplexCooleyTukeyFFT(AbstractComplexDFT):
         if l == 0: return ComplexNaiveDFT(1)
         return ComplexCooleyTukeyFFT.get(l)
 
+class ComplexRadix4FFT(AbstractComplexDFT):
+    """ Radix-4 Cooley-Tukey FFT on complex numbers, where N = 2^L. A radix-2 pass is done first when L is odd. """
+    __slots__ = ('_bit_rev', '_twiddles', '_itwiddles')
+    _bit_rev: list[int]
+    _twiddles: list[tuple[list[complex], list[complex], list[complex]]]
+    """ For each radix-4 pass combining four DFTs of size h, contains `(w^j, w^2j, w^3j)` for j < h, where w = exp(-2pi i/4h). """
+    _itwiddles: list[tuple[list[complex], list[complex], list[complex]]]
+
+    def __init__(self, L:int):
+        super().__init__(1<<L)
+        N = len(self)
+
+        self._bit_rev = bit_reverse_table(L)
+        assert(len(self._bit_rev) == N)
+
+        omega = -2j * cmath.pi / N
+        exp = [cmath.exp(omega * i) for i in range(N)]
+        self._twiddles, self._itwiddles = [], []
+
+        h = 2 if L&1 else 4
+        while 4*h <= N:
+            step = N // (4*h)
+            t = (exp[0:h*step:step], exp[0:2*h*step:2*step], exp[0:3*h*step:3*step])
+            self._twiddles.append(t)
+            self._itwiddles.append(tuple([c.conjugate() for c in tt] for tt in t))
+            h *= 4
+
+    def __str__(self) -> str: return f"ComplexRadix4FFT({len(self).bit_length() - 1})"
+    def __repr__(self) -> str: return f"ComplexRadix4FFT({len(self).bit_length() - 1})"
+
+    def __call__(self, data:list[float|complex], *, inverse:bool=False, out:list[complex]|None=None):
+        out_buffer = bit_reverse_copy(data, self._bit_rev, out)
+        self._butterflies(out_buffer, 0, len(self), inverse)
+        return out_buffer
+
+    def transform_batch(self, buf:list[complex], *, inverse:bool=False) -> list[complex]:
+        bit_reverse_blocks(buf, self._bit_rev)
+        # Chunks of moderate size keep the working set small, which is faster than transforming the whole buffer at once.
+        C = max(len(self), 1<<12)
+        for i in range(0, len(buf), C): self._butterflies(buf, i, min(i+C, len(buf)), inverse)
+        return buf
+
+    def _butterflies(self, out_buffer:list[complex], start:int, stop:int, inverse:bool):
+        """ Transforms each bit-reversed block of `out_buffer[start:stop]` in-place. """
+        N = len(self)
+        if N == 1: return
+        twiddles = self._itwiddles if inverse else self._twiddles
+        mi = 1j if inverse else -1j
+
+        if N.bit_length() % 2 == 0:
+            for i in range(start, stop, 2):
+                ih = i+1
+                oi = out_buffer[i]
+                out_buffer[ih] = oi - (o := out_buffer[ih])
+                out_buffer[i] = oi + o
+            h = 2
+        else:
+            # The first radix-4 pass has trivial twiddle factors.
+            for i in range(start, stop, 4):
+                a0, a2, a1, a3 = out_buffer[i:i+4]
+                s02, d02, s13, d13 = a0+a2, a0-a2, a1+a3, (a1-a3)*mi
+                out_buffer[i:i+4] = (s02+s13, d02+d13, s02-s13, d02-d13)
+            h = 4
+
+        for (t1, t2, t3) in twiddles:
+            l = 4*h
+            for i in range(start, stop, l):
+                for (j, w1, w2, w3) in zip(range(i, i+h), t1, t2, t3):
+                    j1 = j+h; j2 = j1+h; j3 = j2+h
+                    a0 = out_buffer[j]; p2 = out_buffer[j1]*w2; p1 = out_buffer[j2]*w1; p3 = out_buffer[j3]*w3
+                    s02 = a0+p2; d02 = a0-p2; s13 = p1+p3; d13 = (p1-p3)*mi
+                    out_buffer[j] = s02+s13; out_buffer[j1] = d02+d13; out_buffer[j2] = s02-s13; out_buffer[j3] = d02-d13
+            h = l
+
+        if inverse: out_buffer[start:stop] = [x/N for x in out_buffer[start:stop]]
+
+    @staticmethod
+    @functools.cache
+    def get(L:int):
+        return ComplexRadix4FFT(L)
+
+    @staticmethod
+    def get_common_fft(a:int|list, b:int|list) -> AbstractComplexDFT:
+        l = min_convolution_size_power(a, b)
+        if l == 0: return ComplexNaiveDFT(1)
+        return ComplexRadix4FFT.get(l)
+
+class ComplexBluesteinDFT(AbstractComplexDFT):
+    """ Bluestein's (chirp-z) algorithm, computing DFT of an arbitrary size N via a convolution done by a power-of-two FFT. """
+    __slots__ = ('_fft', '_chirp', '_filter')
+    _fft: AbstractComplexDFT
+    _chirp: list[complex]
+    """ `_chirp[k]` contains exp(-pi i k^2 / N). """
+    _filter: list[complex]
+    """ FFT of the conjugated chirp, placed circularly. """
+
+    def __init__(self, n:int, radix:int = 2):
+        super().__init__(n)
+
+        self._fft = fft = get_complex_dft(1 << (2*n-2).bit_length(), radix)
+        omega, n2 = -1j * cmath.pi / n, 2*n
+        self._chirp = chirp = [cmath.exp(omega * (k*k % n2)) for k in range(n)]
+
+        b = [0] * len(fft)
+        b[:n] = [c.conjugate() for c in chirp]
+        if n > 1: b[-(n-1):] = b[n-1:0:-1]
+        self._filter = fft(b)
+
+    def __str__(self) -> str: return f"ComplexBluesteinDFT({len(self)})"
+    def __repr__(self) -> str: return f"ComplexBluesteinDFT({len(self)})"
+
+    def __call__(self, data:list[float|complex], *, inverse:bool=False, out:list[complex]|None=None):
+        N, fft, chirp = len(self), self._fft, self._chirp
+
+        # Inverse DFT is done by conjugating both input and output of DFT.
+        if inverse: a = [x.conjugate()*c for (x, c) in zip(data, chirp)]
+        else: a = [x*c for (x, c) in zip(data, chirp)]
+
+        a = fft(a)
+        a = fft([x*y for (x, y) in zip(a, self._filter)], inverse=True)
+
+        if inverse:
+            inv_n = 1/N
+            ret = [(x*c).conjugate()*inv_n for (x, c) in zip(a, chirp)]
+        else:
+            ret = [x*c for (x, c) in zip(a, chirp)]
+
+        if out is None: return ret
+        out[:N] = ret
+        return out
+
+    def transform_batch(self, buf:list[complex], *, inverse:bool=False) -> list[complex]:
+        N, fft, chirp = len(self), self._fft, self._chirp
+        M = len(fft)
+
+        # Every convolution is done in one scratch buffer, with one batched FFT for each direction.
+        a = [0] * (len(buf)//N * M)
+        for (i, j) in zip(range(0, len(buf), N), range(0, len(a), M)):
+            if inverse: a[j:j+N] = [x.conjugate()*c for (x, c) in zip(buf[i:i+N], chirp)]
+            else: a[j:j+N] = [x*c for (x, c) in zip(buf[i:i+N], chirp)]
+
+        fft.transform_batch(a)
+        for j in range(0, len(a), M): a[j:j+M] = [x*y for (x, y) in zip(a[j:j+M], self._filter)]
+        fft.transform_batch(a, inverse=True)
+
+        for (i, j) in zip(range(0, len(buf), N), range(0, len(a), M)):
+            if inverse:
+                inv_n = 1/N
+                buf[i:i+N] = [(x*c).conjugate()*inv_n for (x, c) in zip(a[j:j+N], chirp)]
+            else:
+                buf[i:i+N] = [x*c for (x, c) in zip(a[j:j+N], chirp)]
+        return buf
+
 @functools.cache
-def get_complex_dft(n:int) -> AbstractComplexDFT:
-    """ Get an AbstractComplexDFT instance that performs DFT on an array with size n. """
+def get_complex_dft(n:int, radix:int = 2) -> AbstractComplexDFT:
+    """
+        Get an AbstractComplexDFT instance that performs DFT on an array with size n.
+        `radix` selects the FFT kernel used for powers of two: either 2 (`ComplexCooleyTukeyFFT`) or 4 (`ComplexRadix4FFT`).
+        For other n, Bluestein's algorithm is used on top of the FFT kernel.
+    """
+    if radix not in (2, 4): raise ValueError(f"Unsupported radix: {radix}")
     if n < 2: return ComplexNaiveDFT(n)
     l = n.bit_length() - 1
-    if n == (1<<l): return ComplexCooleyTukeyFFT.get(l)
-    raise NotImplementedError(f"DFT on {n} elements is not yet supported!")
+    if n == (1<<l): return ComplexRadix4FFT.get(l) if radix == 4 else ComplexCooleyTukeyFFT.get(l)
+    return ComplexBluesteinDFT(n, radix)
 
 def get_common_complex_dft(a:int|list, b:int|list) -> AbstractComplexDFT:
-    return ComplexCooleyTukeyFFT.get_common_fft(a, b)
\ No newline at end of file
+    return ComplexCooleyTukeyFFT.get_common_fft(a, b)
+
+def fft_real_pair(x:list[float], y:list[float], n:int|None = None) -> tuple[list[complex], list[complex]]:
+    """
+        Returns DFTs of two real sequences x and y with size n (by default, the smallest power of two fitting both), using only one complex DFT.
+        x and y are packed into x + iy, and the results are separated via conjugate symmetry.
+    """
+    if n is None: n = 1 << max(len(x)-1, len(y)-1, 0).bit_length()
+    z = get_complex_dft(n)([complex(a, b) for (a, b) in itertools.zip_longest(x[:n], y[:n], fillvalue=0)])
+    zc = [w.conjugate() for w in itertools.chain(z[:1], reversed(z[1:]))]
+    return ([(a+b)*0.5 for (a, b) in zip(z, zc)], [(a-b)*-0.5j for (a, b) in zip(z, zc)])
+
+def convolve_real(a:list[float], b:list[float]) -> list[float]:
+    """
+        Returns the convolution of real sequences a and b, using a complex FFT of size N and an inverse FFT of size N/2.
+        The result has length `len(a)+len(b)-1`. Round the result when integers are convoluted.
+    """
+    if not (a and b): return []
+    if min(len(a), len(b)) <= 16: return [float(x) for x in convolve_naive(a, b)]
+
+    len_c = len(a) + len(b) - 1
+    fft = ComplexCooleyTukeyFFT.get(L := min_convolution_size_power(a, b))
+    N, h = len(fft), len(fft)//2
+
+    # DFT of a+ib yields A+iB, and AB = ((A+iB)^2 - conj(A-iB)^2) / 4i.
+    z = fft([complex(x, y) for (x, y) in itertools.zip_longest(a, b, fillvalue=0)])
+    zc = [w.conjugate() for w in itertools.chain(z[:1], reversed(z[1:]))]
+    c = [(x*x - y*y)*-0.25j for (x, y) in zip(z, zc)]
+
+    # As the result is real, pack even and odd terms into one inverse DFT of size N/2.
+    iexp = fft._iexp
+    w = ComplexCooleyTukeyFFT.get(L-1)([
+        (x+y) + (x-y)*e*1j for (x, y, e) in zip(c[:h], c[h:], iexp)
+    ], inverse=True)
+
+    ret = [0.0] * N
+    ret[0::2] = [v.real*0.5 for v in w]
+    ret[1::2] = [v.imag*0.5 for v in w]
+    del ret[len_c:]
+    return ret
\ No newline at end of file
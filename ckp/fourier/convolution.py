@@ -0,0 +1,121 @@
+"""
+    Exact convolutions of integer sequences, using NTTs over multiple primes or Kronecker substitution.
+"""
+
+import functools
+
+from .complex import convolve_real
+from .ntt import convolve_ntt
+from .util import convolve_naive
+from ..number_theory.primality_test import is_prime
+
+@functools.cache
+def convolution_ntt_primes(k:int) -> tuple[int, ...]:
+    """
+        Returns k distinct primes of form c*2^23 + 1, for multi-prime NTT convolutions.
+        The first three are 998244353, 469762049, and 167772161.
+    """
+    primes = [998244353, 469762049, 167772161]
+    c = 255
+    while len(primes) < k:
+        # Prefer primes below 2^31, then continue with larger ones.
+        if (p := c*(1<<23)+1) not in primes and is_prime(p): primes.append(p)
+        c = c-1 if c <= 255 else c+1
+        if c == 0: c = 256
+    return tuple(primes[:k])
+
+@functools.cache
+def convolution_garner_table(primes:tuple[int, ...]) -> tuple[int, ...]:
+    """ Returns `t` such that `t[i] = pow(primes[0]*...*primes[i-1], -1, primes[i])`, used for Garner's algorithm. """
+    table, m = [1], primes[0]
+    for p in primes[1:]:
+        table.append(pow(m, -1, p))
+        m *= p
+    return tuple(table)
+
+def convolve_multi_prime(a:list[int], b:list[int], bound:int, *, signed:bool = False) -> list[int]:
+    """
+        Returns the convolution of a and b modulo M, where M > bound is a product of NTT-friendly primes.
+        Each result is in range [0, M), or in range (-M/2, M/2] when `signed` is set.
+    """
+    k, m = 1, convolution_ntt_primes(1)[0]
+    while m <= bound:
+        k += 1
+        m *= convolution_ntt_primes(k)[-1]
+
+    primes = convolution_ntt_primes(k)
+    garner = convolution_garner_table(primes)
+
+    c, m = convolve_ntt(a, b, primes[0]), primes[0]
+    for (p, inv_m) in zip(primes[1:], garner[1:]):
+        c = [x + m*((r-x)*inv_m%p) for (x, r) in zip(c, convolve_ntt(a, b, p))]
+        m *= p
+
+    if signed:
+        h = m//2
+        c = [x-m if x > h else x for x in c]
+    return c
+
+def convolve_mod(a:list[int], b:list[int], m:int) -> list[int]:
+    """ Returns the convolution of a and b modulo m, for an arbitrary modulus m. The result has length `len(a)+len(b)-1`. """
+    if not (a and b): return []
+    if min(len(a), len(b)) <= 32: return [z%m for z in convolve_naive(a, b)]
+
+    a = [x%m for x in a]
+    b = [x%m for x in b]
+    return [z%m for z in convolve_multi_prime(a, b, (m-1)*(m-1)*min(len(a), len(b)))]
+
+def convolve_exact(a:list[int], b:list[int]) -> list[int]:
+    """ Returns the exact convolution of integer sequences a and b. The result has length `len(a)+len(b)-1`. """
+    if not (a and b): return []
+    if min(len(a), len(b)) <= 32: return convolve_naive(a, b)
+
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    if min(a) < 0 or min(b) < 0: return convolve_multi_prime(a, b, 2*bound, signed=True)
+    return convolve_multi_prime(a, b, bound)
+
+
+def convolve_kronecker(a:list[int], b:list[int], bound:int|None = None) -> list[int]:
+    """
+        Returns the exact convolution of integer sequences a and b, by packing each sequence into one big integer.
+        `bound` must be an upper bound of absolute values of the result; it's computed from a and b when omitted.
+    """
+    if not (a and b): return []
+    len_c = len(a) + len(b) - 1
+    signed = min(a) < 0 or min(b) < 0
+    if bound is None: bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+
+    # Each coefficient occupies k bytes.
+    k = (bound.bit_length() + signed + 7) // 8 or 1
+    fb = int.from_bytes
+
+    if signed:
+        x = fb(b''.join((v if v > 0 else 0).to_bytes(k, 'little') for v in a), 'little') - fb(b''.join((0 if v > 0 else -v).to_bytes(k, 'little') for v in a), 'little')
+        y = fb(b''.join((v if v > 0 else 0).to_bytes(k, 'little') for v in b), 'little') - fb(b''.join((0 if v > 0 else -v).to_bytes(k, 'little') for v in b), 'little')
+
+        # Add 2^(8k-1) to each coefficient, so that every coefficient becomes non-negative.
+        h = 1 << (8*k-1)
+        s = (x*y + fb((bytes(k-1) + b'\x80') * len_c, 'little')).to_bytes(k*len_c, 'little')
+        return [fb(s[i:i+k], 'little') - h for i in range(0, k*len_c, k)]
+
+    x = fb(b''.join(v.to_bytes(k, 'little') for v in a), 'little')
+    y = x if a is b else fb(b''.join(v.to_bytes(k, 'little') for v in b), 'little')
+    s = (x*y).to_bytes(k*len_c, 'little')
+    return [fb(s[i:i+k], 'little') for i in range(0, k*len_c, k)]
+
+def convolve(a:list[int], b:list[int]) -> list[int]:
+    """
+        Returns the exact convolution of integer sequences a and b. The result has length `len(a)+len(b)-1`.
+
+        The empirically best algorithm is selected based on lengths and coefficients; see `bench/fourier/convolution.py`.
+    """
+    if not (a and b): return []
+    if min(len(a), len(b)) <= 8: return convolve_naive(a, b)
+
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    len_ab = len(a) + len(b)
+
+    # Complex FFT is exact enough when every coefficient is below 2^43.
+    if bound < (1<<43) and len_ab >= (1<<17): return [round(x) for x in convolve_real(a, b)]
+    if len_ab >= (1<<20): return convolve_exact(a, b)
+    return convolve_kronecker(a, b, bound)
\ No newline at end of file
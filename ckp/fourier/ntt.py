@@ -0,0 +1,143 @@
+import functools
+
+from .abc import AbstractDFT
+from .util import bit_reverse_table, min_convolution_size_power, convolve_naive
+
+@functools.cache
+def ntt_root_base(p:int) -> int:
+    """
+        Given an odd prime p, returns a quadratic non-residue g mod p.
+        For every N = 2^L dividing p-1, `pow(g, (p-1)//N, p)` is a primitive N-th root of unity.
+    """
+    g = 2
+    while pow(g, p//2, p) != p-1: g += 1
+    return g
+
+class NTT(AbstractDFT):
+    """ Number-theoretic transform modulo a prime p = c*2^k + 1, where N = 2^L and L <= k. """
+    __slots__ = ('_p', '_bit_rev', '_roots', '_iroots', '_inv_n')
+    _p: int
+    _bit_rev: list[int]
+    _roots: list[int]
+    """ `_roots[h+j]` contains w^j, where w is a primitive (2h)-th root of unity, for every power of two h < N and 0 <= j < h. """
+    _iroots: list[int]
+    _inv_n: int
+
+    def __init__(self, L:int, p:int = 998244353):
+        super().__init__(1<<L)
+        N = len(self)
+        if (p-1) % N: raise ValueError(f"NTT on {N} elements is not possible modulo {p}!")
+
+        self._p = p
+        self._bit_rev = bit_reverse_table(L)
+        self._inv_n = pow(N, -1, p)
+
+        w = pow(ntt_root_base(p), (p-1)//N, p) if N > 1 else 1
+        iw = pow(w, -1, p)
+        exp, iexp = [1] * max(1, N//2), [1] * max(1, N//2)
+        for j in range(1, N//2): exp[j], iexp[j] = exp[j-1]*w%p, iexp[j-1]*iw%p
+
+        self._roots, self._iroots = roots, iroots = [0], [0]
+        h = 1
+        while h < N:
+            roots += exp[::N//(2*h)]
+            iroots += iexp[::N//(2*h)]
+            h += h
+
+    @property
+    def p(self) -> int: return self._p
+
+    def __str__(self) -> str: return f"NTT({len(self).bit_length() - 1}, {self._p})"
+    def __repr__(self) -> str: return f"NTT({len(self).bit_length() - 1}, {self._p})"
+
+    def __call__(self, data:list[int], *, inverse:bool=False, out:list[int]|None=None) -> list[int]:
+        N, p, bit_rev = len(self), self._p, self._bit_rev
+
+        len_data = len(data)
+        if len_data >= N: buf = [data[i] % p for i in bit_rev]
+        else: buf = [(data[i] % p if i < len_data else 0) for i in bit_rev]
+
+        if out is not None:
+            # The butterflies run directly on `out`.
+            out[:N] = buf
+            buf = out
+        self._butterflies(buf, 0, N, inverse)
+
+        src = buf if len(buf) == N else buf[:N]
+        if inverse:
+            inv_n = self._inv_n
+            ret = [x*inv_n%p for x in src]
+        else:
+            ret = [x%p for x in src]
+
+        if out is None: return ret
+        out[:N] = ret
+        return out
+
+    def transform_batch(self, buf:list[int], *, inverse:bool=False) -> list[int]:
+        p = self._p
+        bit_rev = self._bit_rev
+        N = len(bit_rev)
+        for i in range(0, len(buf), N):
+            block = buf[i:i+N]
+            buf[i:i+N] = [block[j] % p for j in bit_rev]
+
+        # Chunks of moderate size keep strided slices short, which is faster than transforming the whole buffer at once.
+        C = max(N, 1<<12)
+        for i in range(0, len(buf), C): self._butterflies(buf, i, min(i+C, len(buf)), inverse)
+
+        if inverse:
+            inv_n = self._inv_n
+            buf[:] = [x*inv_n%p for x in buf]
+        else:
+            buf[:] = [x%p for x in buf]
+        return buf
+
+    def _butterflies(self, buf:list[int], start:int, stop:int, inverse:bool):
+        """ Transforms each bit-reversed block of `buf[start:stop]` in-place, without the final reduction modulo p. """
+        N, p = len(self), self._p
+        roots = self._iroots if inverse else self._roots
+
+        # Additions and subtractions are not reduced; each stage grows the upper bound of values by p.
+        h = 1
+        while h < N:
+            l = h+h
+            if h < (stop-start)//l:
+                # Many short blocks: process the j-th butterfly of every block at once.
+                for j in range(h):
+                    w, jh = roots[h+j], start+j+h
+                    xs, ys = buf[start+j:stop:l], buf[jh:stop:l]
+                    ys = [y*w%p for y in ys] if j else [y%p for y in ys]
+                    buf[start+j:stop:l] = [x+y for (x, y) in zip(xs, ys)]
+                    buf[jh:stop:l] = [x-y+p for (x, y) in zip(xs, ys)]
+            else:
+                # Few long blocks: process each block at once.
+                ws = roots[h:l]
+                for i in range(start, stop, l):
+                    ih, il = i+h, i+l
+                    xs = buf[i:ih]
+                    ys = [y*w%p for (y, w) in zip(buf[ih:il], ws)]
+                    buf[i:ih] = [x+y for (x, y) in zip(xs, ys)]
+                    buf[ih:il] = [x-y+p for (x, y) in zip(xs, ys)]
+            h = l
+
+    @staticmethod
+    @functools.cache
+    def get(L:int, p:int = 998244353) -> 'NTT':
+        return NTT(L, p)
+
+    @staticmethod
+    def get_common_ntt(a:int|list, b:int|list, p:int = 998244353) -> 'NTT':
+        return NTT.get(min_convolution_size_power(a, b), p)
+
+def convolve_ntt(a:list[int], b:list[int], p:int = 998244353) -> list[int]:
+    """ Returns the convolution of a and b modulo p, which is an NTT-friendly prime. The result has length `len(a)+len(b)-1`. """
+    if not (a and b): return []
+    if min(len(a), len(b)) <= 32: return [z%p for z in convolve_naive(a, b)]
+
+    len_c = len(a) + len(b) - 1
+    ntt = NTT.get_common_ntt(a, b, p)
+    fa, fb = ntt(a), ntt(b)
+    fc = ntt([x*y%p for (x, y) in zip(fa, fb)], inverse=True)
+    del fc[len_c:]
+    return fc
@@ -0,0 +1,59 @@
+"""
+    Online (semi-relaxed) convolution, for computing h = f*g where g is known in advance but f is given term by term.
+"""
+
+from .convolution import convolve
+
+class OnlineConvolutionData:
+    """ Data for an online convolution of f and g, where terms of f are pushed one by one. """
+    __slots__ = ('f', 'g', 'acc', 'modulus')
+
+    f: list[int]
+    g: list[int]
+    acc: list[int]
+    """ `acc[i]` contains the sum of `f[j]*g[i-j]` over `j < i` for every block of f already processed. """
+    modulus: int|None
+
+    def __init__(self, g:list[int], modulus:int|None = None):
+        self.f, self.g, self.acc, self.modulus = [], g, [], modulus
+
+    def __len__(self): return len(self.f)
+
+def online_convolution_init(g:list[int], modulus:int|None = None) -> OnlineConvolutionData:
+    """ Create an online convolution with g, optionally modulo `modulus`. Terms of g beyond `len(g)` are regarded as zero. """
+    return OnlineConvolutionData(g, modulus)
+
+def online_convolution_pending(conv:OnlineConvolutionData) -> int:
+    """ For the next index i, returns the sum of `f[j]*g[i-j]` over `j < i`. Useful for recurrences of form `f[i] = sum(f[j]*g[i-j] for j < i)`. """
+    i, acc = len(conv.f), conv.acc
+    return acc[i] if i < len(acc) else 0
+
+def online_convolution_push(conv:OnlineConvolutionData, x:int) -> int:
+    """
+        Appends x to f, and returns `h[i] = sum(f[j]*g[i-j] for j <= i)` for the index i of x.
+
+        Time complexity: amortized O(log^2 n) per push, when convolutions are done by FFT.
+    """
+    f, g, acc, m = conv.f, conv.g, conv.acc, conv.modulus
+    h = online_convolution_pending(conv)
+    if g: h += x * g[0]
+    if m is not None: h %= m
+
+    f.append(x)
+
+    # When a block f[i+1-s:i+1] with s = 2^k is completed, add its contribution with g[s:2s] to future terms.
+    i1, s = len(f), 1
+    while not(i1 % s) and s < len(g):
+        c = convolve(f[i1-s:i1], g[s:s+s])
+        end = i1 + len(c)
+        if len(acc) < end: acc.extend([0] * (end - len(acc)))
+        if m is None: acc[i1:end] = [a+b for (a, b) in zip(acc[i1:end], c)]
+        else: acc[i1:end] = [(a+b)%m for (a, b) in zip(acc[i1:end], c)]
+        s += s
+
+    return h
+
+class OnlineConvolution(OnlineConvolutionData):
+    __slots__ = ()
+    def pending(self) -> int: return online_convolution_pending(self)
+    def push(self, x:int) -> int: return online_convolution_push(self, x)
@@ -25,4 +25,34 @@ def bit_reverse_table(L:int) -> list[int]:
         ii = i * LO_MUL
         for j in range(ii, ii + LO_MUL): ret[j] += v
     
-    return ret
\ No newline at end of file
+    return ret
+
+def bit_reverse_copy(data:list, bit_rev:list[int], out:list|None = None) -> list:
+    """
+        Returns `[data[i] for i in bit_rev]`, where data is padded with zeros.
+        When `out` is given, the result is written to `out` instead. `out` may be `data` itself, in which case data is permuted in-place.
+    """
+    N, len_data = len(bit_rev), len(data)
+    if len_data >= N: buf = [data[i] for i in bit_rev]
+    else: buf = [(data[i] if i < len_data else 0) for i in bit_rev]
+
+    if out is None: return buf
+    out[:N] = buf
+    return out
+
+def bit_reverse_blocks(buf:list, bit_rev:list[int]):
+    """ Permutes each of `len(buf)//len(bit_rev)` consecutive blocks of buf in-place, by `bit_reverse_copy`. """
+    N = len(bit_rev)
+    for i in range(0, len(buf), N):
+        block = buf[i:i+N]
+        buf[i:i+N] = [block[j] for j in bit_rev]
+
+def convolve_naive(a:list, b:list) -> list:
+    """ Returns the convolution of a and b, computed naively. The result has length `len(a)+len(b)-1`. """
+    if not (a and b): return []
+    if len(a) > len(b): a, b = b, a
+    len_b = len(b)
+    c = [0] * (len(a) + len_b - 1)
+    for (i, x) in enumerate(a):
+        if x: c[i:i+len_b] = [z + x*y for (z, y) in zip(c[i:i+len_b], b)]
+    return c
\ No newline at end of file
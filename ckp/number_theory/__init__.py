@@ -3,11 +3,20 @@
 """
 
 from .arithmetic import num_divisors, sum_divisors, euler_phi
-from .factor import factor, divisors
+from .binomial import binomial_table_init, binomial_table_extend, binomial_table_comb, binomial_table_perm, binomial_table_multinomial, binomial_table_catalan, BinomialTable
+from .discrete_log import primitive_root, multiplicative_order, discrete_log, discrete_log_coprime, discrete_log_bsgs
+from .factor import factor, divisors, factor_many, factor_cache_init, factor_cache_query, FactorCache
+from .floor_sum import universal_euclid, sum_floor_linear_table, sum_floor_linear_power
 from .mobius import mobius_naive, mobius_from_factors, mobius_sieve_init
+from .multiplicative_sieve import multiplicative_sieve, multiplicative_sieve_factor
+from .multiplicative_sieve import multiplicative_phi, multiplicative_mu, multiplicative_num_divisors, multiplicative_sum_divisors
+from .multiplicative_sum import multiplicative_prefix_sum, dirichlet_hyperbola_sum, mertens, totient_sum
 from .misc import iterate_idiv, extended_gcd, factorial_prime_power, comb_prime_power
 from .modular import solve_linear_mod, count_zero_mod, sum_floor_linear
-from .modular import comb_mod_prime, chinese_mod, legendre_symbol, jacobi_symbol, ZMod
-from .modular_sqrt import sqrt_mod_prime, sqrt_mod_prime_power, sqrt_mod
-from .primality_test import is_prime
-from .prime_sieve import prime_sieve_init, prime_sieve_extend, prime_sieve_primes, prime_sieve_query, prime_sieve_factor, PrimeSieve
\ No newline at end of file
+from .modular import batch_inverse, comb_mod_prime, comb_mod_prime_power, comb_mod, chinese_mod, legendre_symbol, jacobi_symbol, ZMod, ZModContext, ZModArray
+from .modular_sqrt import sqrt_mod_prime, sqrt_mod_prime_many, sqrt_mod_prime_cipolla, sqrt_mod_prime_tonelli_shanks, sqrt_mod_prime_power, sqrt_mod
+from .primality_test import is_prime, is_prime_many
+from .prime_count import prime_count, prime_sum, prime_sum_table, prime_count_meissel_lehmer, power_sum
+from .prime_sieve import prime_sieve_init, prime_sieve_extend, prime_sieve_primes, prime_sieve_query, prime_sieve_factor, PrimeSieve
+from .prime_sieve import compact_prime_sieve_init, compact_prime_sieve_extend, compact_prime_sieve_primes, compact_prime_sieve_query, CompactPrimeSieve
+from .prime_sieve import prime_sieve_segmented, prime_sieve_segmented_iter
\ No newline at end of file
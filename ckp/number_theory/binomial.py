@@ -0,0 +1,82 @@
+"""
+    Precomputed factorial tables for binomial coefficients modulo a prime.
+"""
+
+class BinomialTableData:
+    """ Tables of factorials and inverse factorials modulo a prime p, which grow as needed. """
+    __slots__ = ('fact', 'inv_fact', 'p')
+
+    fact: list[int]
+    """ `fact[i]` contains `i! % p`. """
+
+    inv_fact: list[int]
+    """ `inv_fact[i]` contains the inverse of `i!` modulo p. """
+
+    p: int
+
+    def __init__(self, n: int = 1, p: int = 998244353):
+        self.fact, self.inv_fact, self.p = [1], [1], p
+        binomial_table_extend(self, n)
+
+class BinomialTable(BinomialTableData):
+    __slots__ = ()
+    def extend(self, n: int): binomial_table_extend(self, n)
+    def comb(self, n: int, k: int) -> int: return binomial_table_comb(self, n, k)
+    def perm(self, n: int, k: int) -> int: return binomial_table_perm(self, n, k)
+    def multinomial(self, ks: list[int]) -> int: return binomial_table_multinomial(self, ks)
+    def catalan(self, n: int) -> int: return binomial_table_catalan(self, n)
+
+def binomial_table_init(n: int = 1, p: int = 998244353) -> BinomialTableData:
+    """ Create a table of factorials up to `n!`, modulo a prime `p > n`. """
+    return BinomialTableData(n, p)
+
+def binomial_table_extend(table: BinomialTableData, n: int):
+    """
+        Extend the table so that it contains `n!`. The table at least doubles, so that lazy growth takes amortized O(1) per entry.
+        Only one modular exponentiation is done per extension.
+    """
+    fact, inv_fact, p = table.fact, table.inv_fact, table.p
+    if n < (old_len := len(fact)): return
+    if n >= p: raise ValueError(f"The table can't contain {n}! modulo {p}.")
+
+    new_len = min(max(n+1, 2*old_len), p)
+    x = fact[-1]
+    for i in range(old_len, new_len):
+        x = x*i % p
+        fact.append(x)
+
+    # Inverse factorials are computed backwards from the last one.
+    y = pow(x, -1, p)
+    ext = [0] * (new_len - old_len)
+    for i in range(new_len-1, old_len-1, -1):
+        ext[i-old_len] = y
+        y = y*i % p
+    inv_fact += ext
+
+def binomial_table_comb(table: BinomialTableData, n: int, k: int) -> int:
+    """ Returns nCk modulo p. """
+    if not 0 <= k <= n: return 0
+    if n >= len(table.fact): binomial_table_extend(table, n)
+    p, inv_fact = table.p, table.inv_fact
+    return table.fact[n] * inv_fact[k] % p * inv_fact[n-k] % p
+
+def binomial_table_perm(table: BinomialTableData, n: int, k: int) -> int:
+    """ Returns nPk = n!/(n-k)! modulo p. """
+    if not 0 <= k <= n: return 0
+    if n >= len(table.fact): binomial_table_extend(table, n)
+    return table.fact[n] * table.inv_fact[n-k] % table.p
+
+def binomial_table_multinomial(table: BinomialTableData, ks: list[int]) -> int:
+    """ Returns `(k1+k2+...)! / (k1! * k2! * ...)` modulo p. Every k must be non-negative. """
+    if (n := sum(ks)) >= len(table.fact): binomial_table_extend(table, n)
+    p, inv_fact = table.p, table.inv_fact
+    x = table.fact[n]
+    for k in ks: x = x * inv_fact[k] % p
+    return x
+
+def binomial_table_catalan(table: BinomialTableData, n: int) -> int:
+    """ Returns the n-th Catalan number `(2n)! / (n! * (n+1)!)` modulo p. """
+    if n < 0: return 0
+    if (m := max(2*n, n+1)) >= len(table.fact): binomial_table_extend(table, m)
+    p, inv_fact = table.p, table.inv_fact
+    return table.fact[2*n] * inv_fact[n] % p * inv_fact[n+1] % p
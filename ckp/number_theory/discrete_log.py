@@ -0,0 +1,107 @@
+"""
+    Primitive roots and discrete logarithms.
+"""
+
+import functools, math
+from collections import Counter
+
+from .arithmetic import euler_phi
+from .factor import factor
+from .modular import chinese_mod
+
+@functools.cache
+def primitive_root(p: int) -> int:
+    """ Given that p is a prime number, returns the smallest primitive root modulo p. """
+    if p == 2: return 1
+    qs = [(p-1)//q for q in set(factor(p-1))]
+    g = 2
+    while any(pow(g, e, p) == 1 for e in qs): g += 1
+    return g
+
+@functools.cache
+def multiplicative_order_factors(a: int, m: int) -> tuple[tuple[int, int], ...]:
+    """ Given that a and m are coprime, returns the factorization of the multiplicative order of a modulo m, as a tuple of (q, e). """
+    if m == 1: return ()
+    n = euler_phi(m)
+    factors = Counter(factor(n))
+    for q in factors:
+        while factors[q] and pow(a, n//q, m) == 1:
+            n //= q
+            factors[q] -= 1
+    return tuple((q, e) for (q, e) in sorted(factors.items()) if e)
+
+def multiplicative_order(a: int, m: int) -> int:
+    """ Given that a and m are coprime, returns the smallest k > 0 such that `pow(a, k, m) == 1`. """
+    return math.prod(q**e for (q, e) in multiplicative_order_factors(a % m, m))
+
+@functools.lru_cache(maxsize=16)
+def discrete_log_bsgs_table(g: int, m: int, s: int) -> dict[int, int]:
+    """ Returns the baby-step table `{g^j % m: j}` for `0 <= j < s`, keeping the smallest j. The 16 most recently used tables are cached, keyed by (g, m, s). """
+    powers = [1 % m] * s
+    for j in range(1, s): powers[j] = powers[j-1] * g % m
+    return dict(zip(reversed(powers), range(s-1, -1, -1)))
+
+def discrete_log_bsgs(g: int, h: int, m: int, n: int) -> int:
+    """
+        Returns the smallest `0 <= x < n` such that `pow(g, x, m) == h`, or -1 if there's no such x,
+        given that g and m are coprime and the order of g divides n, using baby-step giant-step.
+
+        Time complexity: O(sqrt(n)), where the baby-step table for `(g, m, isqrt(n-1)+1)` is cached.
+    """
+    s = math.isqrt(n-1) + 1
+    table = discrete_log_bsgs_table(g, m, s)
+    giant = pow(g, -s, m)
+    y = h % m
+    for i in range(0, n, s):
+        if (j := table.get(y)) is not None: return i+j if i+j < n else -1
+        y = y * giant % m
+    return -1
+
+def discrete_log_coprime(g: int, h: int, m: int) -> int:
+    """
+        Given that g and m are coprime, returns the smallest `x >= 0` such that `pow(g, x, m) == h % m`, or -1 if there's no such x.
+        The Pohlig-Hellman algorithm is used when the order of g is composite, so that only BSGS on its prime factors is needed.
+    """
+    if m == 1: return 0
+    g, h = g % m, h % m
+    order_factors = multiplicative_order_factors(g, m)
+    n = math.prod(q**e for (q, e) in order_factors)
+    if len(order_factors) <= 1 and all(e == 1 for (_, e) in order_factors): return discrete_log_bsgs(g, h, m, max(n, 1))
+
+    residues = []
+    for (q, e) in order_factors:
+        # Solve x mod q^e digit by digit, in the subgroup of order q^e.
+        qe = q**e
+        gi, hi = pow(g, n//qe, m), pow(h, n//qe, m)
+        gamma = pow(gi, qe//q, m)
+        gi_inv = pow(gi, -1, m)
+        x = 0
+        for k in range(e):
+            hk = pow(pow(gi_inv, x, m) * hi % m, qe // q**(k+1), m)
+            if (d := discrete_log_bsgs(gamma, hk, m, q)) < 0: return -1
+            x += d * q**k
+        residues.append((x, qe))
+
+    x = chinese_mod(*residues)
+    return x if pow(g, x, m) == h else -1
+
+def discrete_log(g: int, h: int, m: int) -> int:
+    """
+        Returns the smallest `x >= 0` such that `pow(g, x, m) == h % m`, or -1 if there's no such x.
+        g and m don't need to be coprime. Baby-step tables are cached per (g, m, table size), so many queries against one base are amortized.
+    """
+    if m == 1: return 0
+    g, h = g % m, h % m
+
+    # Reduce to the coprime case: k * g^(x-add) = h (mod m), with gcd(g, m) = 1.
+    k, add = 1 % m, 0
+    while (d := math.gcd(g, m)) > 1:
+        if h == k: return add
+        if h % d: return -1
+        h, m = h//d, m//d
+        k = k * (g//d) % m
+        add += 1
+        g %= m
+
+    if (x := discrete_log_coprime(g, h * pow(k, -1, m), m)) < 0: return -1
+    return x + add
@@ -1,5 +1,7 @@
 import math
+from collections import Counter, OrderedDict
 from .primality_test import is_prime
+from .prime_sieve import PrimeSieve, prime_sieve_extend, prime_sieve_factor
 
 def factor_trial_division(n: int):
     """ Factor `n` using trial division.. Yields every prime factors of `n` (with duplicates), in no particular order. """
@@ -43,9 +45,39 @@ def pollard_rho_find_divisor(n: int, start: int = 2):
         if (d := g((y:=x*x%n+1) - p, n)) != 1: return 0 if d == n else d
         l += (y, x:=y*y%n+1)
 
+def pollard_rho_brent_find_divisor(n: int, start: int = 2, batch: int = 128):
+    """
+        Returns a proper divisor of `n` (or 0 on failure), using Pollard's rho algorithm with Brent's cycle detection.
+        Differences are multiplied together, and gcd is computed only once per `batch` steps.
+    """
+    g = math.gcd
+    if 1 < (d := g(n, start)) < n: return d
+
+    y, r, q, d = start, 1, 1, 1
+    while d == 1:
+        x = y
+        for _ in range(r): y = y*y%n + 1
+        k = 0
+        while k < r and d == 1:
+            ys = y
+            for _ in range(min(batch, r-k)):
+                y = y*y%n + 1
+                q = q*(x-y)%n
+            d = g(q, n)
+            k += batch
+        r += r
+
+    if d == n:
+        # The product became 0 mod n; retry the last batch step by step.
+        while (d := g(x - (ys := ys*ys%n + 1), n)) == 1: pass
+
+    return 0 if d == n else d
+
 def factor_pollard_rho(n: int):
     """
         Using Pollard's rho algorithm, yields every prime factors of `n` (with duplicates), in no particular order.
+
+        Brent's variant is used for `n >= 2^37`; see `bench/number_theory/factor.py`.
     """
     if n < 2: return
 
@@ -70,8 +102,9 @@ def factor_pollard_rho(n: int):
             yield nsq_factor
         return
     
+    find_divisor = pollard_rho_brent_find_divisor if n >= (1<<37) else pollard_rho_find_divisor
     start = 2
-    while not(d := pollard_rho_find_divisor(n, start)):
+    while not(d := find_divisor(n, start)):
         start += 1
     
     yield from factor(d)
@@ -88,8 +121,80 @@ def factor(n:int):
     if n < 1500: yield from factor_trial_division(n)
     else: yield from factor_pollard_rho(n)
 
+class FactorCacheData:
+    """ A prime sieve and an LRU memo of factorizations, shared between many factorizations. """
+    __slots__ = ('sieve', 'sieve_limit', 'memo', 'memo_size')
+
+    sieve: PrimeSieve
+    sieve_limit: int
+    """ Numbers up to `sieve_limit` are factored with `sieve`, which is extended as needed. """
+
+    memo: OrderedDict[int, tuple[int, ...]]
+    memo_size: int
+    """ Maximum number of factorizations in `memo`; zero disables memoization. """
+
+    def __init__(self, sieve_limit: int = 10**6, memo_size: int = 0):
+        self.sieve = PrimeSieve()
+        self.sieve_limit = sieve_limit
+        self.memo = OrderedDict()
+        self.memo_size = memo_size
+
+class FactorCache(FactorCacheData):
+    __slots__ = ()
+    def factor(self, n: int) -> list[int]: return factor_cache_query(self, n)
+
+def factor_cache_init(sieve_limit: int = 10**6, memo_size: int = 0) -> FactorCacheData:
+    return FactorCacheData(sieve_limit, memo_size)
+
+def factor_cache_query(cache: FactorCacheData, n: int) -> list[int]:
+    """
+        Returns every prime factors of `n` (with duplicates) in increasing order.
+        The sieve is used for factors up to `cache.sieve_limit`, and Pollard's rho algorithm is used otherwise.
+    """
+    if n < 2: return []
+
+    memo = cache.memo
+    if (factors := memo.get(n)) is not None:
+        memo.move_to_end(n)
+        return list(factors)
+
+    sieve, sieve_limit, ret = cache.sieve, cache.sieve_limit, []
+    def collect(m: int):
+        if m <= sieve_limit:
+            ret.extend(prime_sieve_factor(sieve, m))
+            return
+        if is_prime(m):
+            ret.append(m)
+            return
+        find_divisor = pollard_rho_brent_find_divisor if m >= (1<<37) else pollard_rho_find_divisor
+        start = 2
+        while not(d := find_divisor(m, start)): start += 1
+        collect(d)
+        collect(m // d)
+
+    # Small factors are removed first, as Pollard's rho algorithm is slow for them.
+    m = n
+    for p in (2, 3, 5, 7):
+        while not(m%p): ret.append(p); m //= p
+    if m > 1: collect(m)
+    ret.sort()
+
+    if cache.memo_size > 0:
+        memo[n] = tuple(ret)
+        if len(memo) > cache.memo_size: memo.popitem(last=False)
+    return ret
+
+def factor_many(ns: list[int], cache: FactorCacheData|None = None) -> list[list[int]]:
+    """
+        Returns the list of prime factors (with duplicates, in increasing order) of each number in `ns`.
+
+        A `cache` created by `factor_cache_init` can be provided to share the sieve and memoized factorizations between calls.
+    """
+    if cache is None: cache = FactorCacheData()
+    if ns and (max_n := min(max(ns), cache.sieve_limit)) > 1: prime_sieve_extend(cache.sieve, max_n)
+    return [factor_cache_query(cache, n) for n in ns]
+
 import itertools
-from collections import Counter
 
 def divisors(n:int, n_factors:Counter|list[int]|None = None):
     """
@@ -0,0 +1,86 @@
+"""
+    Generalized floor sums, and the universal Euclidean algorithm folding a monoid along the lattice path of a line.
+"""
+
+from math import comb
+
+def universal_euclid_pow(x, k:int, monoid_op, monoid_zero):
+    """ Returns x multiplied k times with `monoid_op`, for k >= 0. """
+    ret = monoid_zero
+    while k:
+        if k&1: ret = monoid_op(ret, x)
+        if k := k>>1: x = monoid_op(x, x)
+    return ret
+
+def universal_euclid(a:int, b:int, m:int, n:int, U, R, monoid_op, monoid_zero):
+    """
+        Returns the product of `U^(f(x) - f(x-1)) * R` over x in range(n), where `f(x) = (a*x + b) // m` and `f(-1) = 0`.
+        In other words, U and R are multiplied along the lattice path below the line, so that exactly `f(x)` U's precede the R for x.
+        a and b must be non-negative, and m must be positive.
+
+        For example, `sum_floor_linear(a, b, m, n)` is the third element of the product with
+        `U = (1, 0, 0)`, `R = (0, 1, 0)`, and `(u1, r1, s1) * (u2, r2, s2) = (u1+u2, r1+r2, s1+s2+u1*r2)`.
+
+        Time complexity: O(log(a+m+n)) monoid operations
+    """
+    if n <= 0: return monoid_zero
+    if a < 0 or b < 0 or m <= 0: raise ValueError("a and b must be non-negative, and m must be positive.")
+
+    def pow_(x, k:int): return universal_euclid_pow(x, k, monoid_op, monoid_zero)
+
+    def rec(p:int, q:int, r:int, l:int, U, R):
+        """ Product for `f(x) = (p*x + r) // q` over `1 <= x <= l`, where `0 <= r < q`. """
+        if not l: return monoid_zero
+        if p >= q: p, R = p%q, monoid_op(pow_(U, p//q), R)
+        if not (k := (p*l + r) // q): return pow_(R, l)
+        # Swap the roles of x and y: the j-th U is preceded by `((q*j - r - 1) // p)` R's.
+        ret = monoid_op(pow_(R, (q-r-1)//p), U)
+        ret = monoid_op(ret, rec(q, p, (q-r-1)%p, k-1, R, U))
+        return monoid_op(ret, pow_(R, l - (q*k - r - 1)//p))
+
+    return monoid_op(monoid_op(pow_(U, b//m), R), rec(a, m, b%m, n-1, U, R))
+
+def sum_floor_linear_table(a:int, b:int, m:int, n:int, k1:int, k2:int) -> list[list[int]]:
+    """
+        Returns t such that `t[i][j] = sum(x**i * ((a*x + b) // m)**j for x in range(n))`, for every `0 <= i <= k1` and `0 <= j <= k2`.
+        m must be non-zero.
+
+        Time complexity: O(k1 * k2 * (k1+k2) * log(a+m+n))
+    """
+    if m == 0: raise ValueError("m must be non-zero.")
+    if m < 0: a, b, m = -a, -b, -m
+
+    binom = [[comb(i, j) for j in range(i+1)] for i in range(max(k1, k2)+1)]
+
+    # A node `(u, r, s)` represents a path with u U's and r R's, where `s[i][j]` is the sum of `x^i * y^j` over each R at (x, y).
+    def op(A, B):
+        ua, ra, sa = A
+        ub, rb, sb = B
+        pu, pr = [1], [1]
+        for _ in range(k2): pu.append(pu[-1] * ua)
+        for _ in range(k1): pr.append(pr[-1] * ra)
+        # Shift B by (ra, ua): (x+ra)^i * (y+ua)^j.
+        t = [[sum(c*pu[j-jj]*y for (jj, (c, y)) in enumerate(zip(binom[j], row))) for j in range(k2+1)] for row in sb]
+        return ua+ub, ra+rb, [
+            [sa[i][j] + sum(c*pr[i-ii]*t[ii][j] for (ii, c) in enumerate(binom[i])) for j in range(k2+1)]
+            for i in range(k1+1)
+        ]
+
+    zero = (0, 0, [[0] * (k2+1) for _ in range(k1+1)])
+    if n <= 0: return zero[2]
+
+    # Reduce to 0 <= a, b < m; negative quotients are fine, as they only shift y.
+    qa, a = divmod(a, m)
+    qb, b = divmod(b, m)
+    s = [[0] * (k2+1) for _ in range(k1+1)]
+    s[0][0] = 1
+    U, R = (1, 0, zero[2]), op((0, 1, s), (qa, 0, zero[2]))
+    return op((qb, 0, zero[2]), universal_euclid(a, b, m, n, U, R, op, zero))[2]
+
+def sum_floor_linear_power(a:int, b:int, m:int, n:int, k1:int, k2:int) -> int:
+    """
+        Computes `sum(x**k1 * ((a*x + b) // m)**k2 for x in range(n))`. m must be non-zero.
+
+        Time complexity: O(k1 * k2 * (k1+k2) * log(a+m+n))
+    """
+    return sum_floor_linear_table(a, b, m, n, k1, k2)[k1][k2]
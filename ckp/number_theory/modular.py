@@ -2,8 +2,13 @@
     Various functions related to modular arithmetic.
 """
 
+import functools
+from collections import Counter
 from math import gcd
-from .misc import factorial_prime_power
+from itertools import accumulate
+from operator import mul
+from .factor import factor
+from .misc import factorial_prime_power, comb_prime_power
 
 def solve_linear_mod(a:int, b:int, m:int) -> int:
     """ Returns the minimal x >= 0 such that `(ax + b) % m == 0`, or -1 if no such x exists. """
@@ -60,6 +65,22 @@ def sum_floor_linear(a:int, b:int, m:int, n:int) -> int:
         n, b = divmod(v, m)
         m, a = a, m
 
+def batch_inverse(xs:list[int], m:int) -> list[int]:
+    """
+        Returns `[pow(x, -1, m) for x in xs]`, using only one modular exponentiation. Every x must be invertible modulo m.
+
+        Time complexity: O(len(xs) + log m)
+    """
+    if not xs: return []
+    prefix = list(accumulate(xs, lambda x, y: x*y%m))
+    inv = pow(prefix[-1], -1, m)
+    ret = [0] * len(xs)
+    for i in range(len(xs)-1, 0, -1):
+        ret[i] = inv*prefix[i-1] % m
+        inv = inv*xs[i] % m
+    ret[0] = inv
+    return ret
+
 def _comb_mod_prime_small_k(n:int, k:int, p:int):
     """
         Given that p is a prime number, and k < min(n, p-1), returns nCk mod p.
@@ -97,6 +118,64 @@ def comb_mod_prime(n:int, k:int, p:int) -> int:
         m = (m * _comb_mod_prime_small_k(nr, kr, p)) % p
     return (m * _comb_mod_prime_small_k(n, k, p)) % p
 
+@functools.cache
+def comb_mod_prime_power_table(p:int, e:int) -> list[int]:
+    """ Returns `t` such that `t[i]` is the product of every `1 <= j <= i` not divisible by p, modulo `p^e`, for `i < p^e`. """
+    q = p**e
+    t = [1] * q
+    for i in range(2, q): t[i] = t[i-1] * i % q if i%p else t[i-1]
+    return t
+
+def comb_mod_prime_power(n:int, k:int, p:int, e:int) -> int:
+    """
+        Given that p is a prime number, returns nCk mod p^e, using Granville's generalization of Lucas' theorem.
+        Tables of size p^e are cached and reused when `p^e <= 10^6`.
+        Otherwise, nCk is computed as a product of `min(k, n-k)` terms with powers of p removed, when it is cheaper.
+
+        Time complexity: O(log n) with a cached table, O(min(k, n-k, p^e) log n) otherwise.
+    """
+    if not 0 <= k <= n: return 0
+    q = p**e
+    if (v := comb_prime_power(n, k, p)) >= e: return 0
+    if e == 1 and q > 10**6: return comb_mod_prime(n, k, p)
+    if q > 10**6 and (r := min(k, n-k)) < q:
+        x = y = 1
+        for i in range(r):
+            a, b = n-i, i+1
+            while a%p == 0: a //= p
+            while b%p == 0: b //= p
+            x, y = x*a % q, y*b % q
+        return pow(p, v, q) * x * pow(y, -1, q) % q
+
+    table = comb_mod_prime_power_table(p, e) if q <= 10**6 else None
+    # Product of every unit modulo p^e is -1, except for 2^e with e >= 3.
+    neg = not (p == 2 and e >= 3)
+
+    def unit_factorial(x:int) -> int:
+        """ Returns `x! / p^(factorial_prime_power(x, p))` modulo q. """
+        r = 1
+        while x > 1:
+            c, y = divmod(x, q)
+            if neg and (c & 1): r = -r
+            if table is not None: r = r * table[y] % q
+            else:
+                for i in range(2, y+1):
+                    if i%p: r = r*i % q
+            x //= p
+        return r % q
+
+    return pow(p, v, q) * unit_factorial(n) * pow(unit_factorial(k) * unit_factorial(n-k), -1, q) % q
+
+@functools.cache
+def comb_mod_moduli(m:int) -> tuple[tuple[int, int], ...]:
+    """ Returns the factorization of m as a tuple of (p, e), cached for `comb_mod`. """
+    return tuple(Counter(factor(m)).items())
+
+def comb_mod(n:int, k:int, m:int) -> int:
+    """ Returns nCk mod m for an arbitrary modulus `m >= 1`, by combining nCk mod p^e for every prime power p^e dividing m. """
+    if not 0 <= k <= n or m == 1: return 0
+    return chinese_mod(*((comb_mod_prime_power(n, k, p, e), p**e) for (p, e) in comb_mod_moduli(m)))
+
 def chinese_mod(*l) -> int:
     """ Given (a1, m1), (a2, m2), ..., where 0 <= ai < mi and every pairs of (mi, mj) for i != j are coprime, returns x < m1*m2*... such that x = ai mod mi for every i. """
     if len(l) == 1: return l[0][0]
@@ -165,6 +244,7 @@ class ZMod:
         Using this class, at the expense of performance (4x slower than simply using `%`), may simplify codes involving modular arithmetic and circular objects.
 
         Still, as the performance hit is severe, other functions involving modular arithmetic does *not* support this class.
+        For hot loops, use `ZModContext` or `ZModArray` instead.
     """
 
     __slots__ = ('x', 'm')
@@ -263,4 +343,150 @@ class ZMod:
         if isinstance(other, int):
             self.x = pow(self.x, other, m)
             return self
-        return NotImplemented
\ No newline at end of file
+        return NotImplemented
+
+class ZModContext:
+    """
+        Arithmetic modulo a fixed m on plain integers, without per-object overhead of `ZMod`.
+        Bulk operations on lists are done in a single comprehension, and inverses are cached.
+    """
+
+    __slots__ = ('m', '_inv')
+    m: int
+    _inv: dict[int, int]
+
+    def __init__(self, m:int): self.m, self._inv = m, {}
+
+    def __repr__(self): return f"ZModContext({self.m})"
+
+    def add(self, x:int, y:int) -> int: return (x+y) % self.m
+    def sub(self, x:int, y:int) -> int: return (x-y) % self.m
+    def mul(self, x:int, y:int) -> int: return x*y % self.m
+    def neg(self, x:int) -> int: return (-x) % self.m
+    def pow(self, x:int, k:int) -> int: return pow(x, k, self.m)
+
+    def inv(self, x:int) -> int:
+        """ Returns the inverse of x modulo m, which is cached. """
+        m, cache = self.m, self._inv
+        if (y := cache.get(x := x%m)) is None: y = cache[x] = pow(x, -1, m)
+        return y
+
+    def div(self, x:int, y:int) -> int: return x * self.inv(y) % self.m
+
+    def add_many(self, xs:list[int], ys:list[int]) -> list[int]:
+        m = self.m
+        return [(x+y) % m for (x, y) in zip(xs, ys)]
+
+    def sub_many(self, xs:list[int], ys:list[int]) -> list[int]:
+        m = self.m
+        return [(x-y) % m for (x, y) in zip(xs, ys)]
+
+    def mul_many(self, xs:list[int], ys:list[int]) -> list[int]:
+        m = self.m
+        return [x*y % m for (x, y) in zip(xs, ys)]
+
+    def scale_many(self, xs:list[int], c:int) -> list[int]:
+        m = self.m
+        return [x*c % m for x in xs]
+
+    def inv_many(self, xs:list[int]) -> list[int]: return batch_inverse(xs, self.m)
+
+    def dot(self, xs:list[int], ys:list[int]) -> int:
+        """ Returns `sum(x*y for (x, y) in zip(xs, ys)) % m`, reducing only once. """
+        return sum(map(mul, xs, ys)) % self.m
+
+    def sum(self, xs:list[int]) -> int: return sum(xs) % self.m
+
+    def array(self, xs:list[int]) -> 'ZModArray': return ZModArray(xs, self.m)
+
+class ZModArray:
+    """ A list of elements of Z/mZ, where arithmetic operations are elementwise. """
+
+    __slots__ = ('data', 'm')
+    data: list[int]
+    m: int
+
+    def __init__(self, data:list[int], m:int): self.data, self.m = [x % m for x in data], m
+
+    @staticmethod
+    def _wrap(data:list[int], m:int) -> 'ZModArray':
+        """ Create an array from already-reduced data, without copying. """
+        arr = ZModArray.__new__(ZModArray)
+        arr.data, arr.m = data, m
+        return arr
+
+    def __repr__(self): return f"ZModArray({self.data}, {self.m})"
+    def __len__(self): return len(self.data)
+    def __iter__(self): return iter(self.data)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice): return ZModArray._wrap(self.data[i], self.m)
+        return self.data[i]
+
+    def __setitem__(self, i:int, x:int): self.data[i] = x % self.m
+
+    def __eq__(self, other):
+        if isinstance(other, ZModArray): return self.m == other.m and self.data == other.data
+        if isinstance(other, list): return self.data == [x % self.m for x in other]
+        return NotImplemented
+
+    def _operand(self, other):
+        """ Returns the list of other's elements if other is an array of the same modulus, other itself if it's an int, or None. """
+        if isinstance(other, ZModArray):
+            if other.m != self.m: raise ValueError(f"Modulus mismatch: {self.m} and {other.m}")
+            return other.data
+        if isinstance(other, list): return other
+        if isinstance(other, int): return other
+        return None
+
+    def __add__(self, other):
+        m = self.m
+        if (o := self._operand(other)) is None: return NotImplemented
+        if isinstance(o, int): return ZModArray._wrap([(x+o) % m for x in self.data], m)
+        return ZModArray._wrap([(x+y) % m for (x, y) in zip(self.data, o)], m)
+
+    def __sub__(self, other):
+        m = self.m
+        if (o := self._operand(other)) is None: return NotImplemented
+        if isinstance(o, int): return ZModArray._wrap([(x-o) % m for x in self.data], m)
+        return ZModArray._wrap([(x-y) % m for (x, y) in zip(self.data, o)], m)
+
+    def __rsub__(self, other):
+        m = self.m
+        if (o := self._operand(other)) is None: return NotImplemented
+        if isinstance(o, int): return ZModArray._wrap([(o-x) % m for x in self.data], m)
+        return ZModArray._wrap([(y-x) % m for (x, y) in zip(self.data, o)], m)
+
+    def __mul__(self, other):
+        m = self.m
+        if (o := self._operand(other)) is None: return NotImplemented
+        if isinstance(o, int): return ZModArray._wrap([x*o % m for x in self.data], m)
+        return ZModArray._wrap([x*y % m for (x, y) in zip(self.data, o)], m)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __iadd__(self, other):
+        if (res := self.__add__(other)) is NotImplemented: return res
+        self.data[:] = res.data
+        return self
+
+    def __isub__(self, other):
+        if (res := self.__sub__(other)) is NotImplemented: return res
+        self.data[:] = res.data
+        return self
+
+    def __imul__(self, other):
+        if (res := self.__mul__(other)) is NotImplemented: return res
+        self.data[:] = res.data
+        return self
+
+    def __neg__(self):
+        m = self.m
+        return ZModArray._wrap([(-x) % m for x in self.data], m)
+
+    def dot(self, other) -> int:
+        """ Returns the dot product with other, modulo m. """
+        return sum(map(mul, self.data, self._operand(other))) % self.m
+
+    def sum(self) -> int: return sum(self.data) % self.m
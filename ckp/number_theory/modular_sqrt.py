@@ -1,46 +1,86 @@
+import functools
 from collections import Counter
-from .modular import chinese_mod, legendre_symbol, any_non_quadratic_residue_mod_prime
+from .modular import chinese_mod, any_non_quadratic_residue_mod_prime
 from .factor import factor
 
-def sqrt_mod_prime(n:int, p:int) -> int:
-    """
-        For a prime number p, either returns x such that x^2 = n mod p, or returns 0 if there's no such x.
-        
-        This function implements the Tonelli-Shanks algorithm.
-    """
-
-    if p == 2: return n & 1
-    if legendre_symbol(n, p) != 1: return 0
-
-    q = p-1
-    s = 0
-
+@functools.cache
+def sqrt_mod_prime_params(p:int) -> tuple[int, int, int]:
+    """ For an odd prime number p, returns `(q, s, c)` such that `p-1 = q * 2^s` for an odd q, and `c = z^q` for a non quadratic residue z. Cached per p. """
+    q, s = p-1, 0
     while not(q&1):
         q //= 2
         s += 1
+    return q, s, pow(any_non_quadratic_residue_mod_prime(p), q, p)
+
+def sqrt_mod_prime_tonelli_shanks(n:int, p:int) -> int:
+    """
+        For an odd prime number p, either returns x such that x^2 = n mod p, or returns 0 if there's no such x, using the Tonelli-Shanks algorithm.
 
-    z = any_non_quadratic_residue_mod_prime(p)
-    m = s
-    c = pow(z, q, p)
+        Time complexity: O(log p + s^2), where s is the 2-adic valuation of p-1.
+    """
+    q, m, c = sqrt_mod_prime_params(p)
     t = pow(n, q, p)
     r = pow(n, (q+1)//2, p)
 
     while t >= 2:
-        ti = pow(t, 2, p)
+        ti = t*t % p
         i = 1
         while ti != 1:
-            ti = pow(ti, 2, p)
+            ti = ti*ti % p
             i += 1
+        # t^(2^(m-1)) != 1 means that n is a non quadratic residue.
+        if i >= m: return 0
         b = c
-        for _ in range(m-i-1):
-            b = pow(b, 2, p)
+        for _ in range(m-i-1): b = b*b % p
         m = i
-        c = pow(b, 2, p)
+        c = b*b % p
         t = (t*c) % p
         r = (r*b) % p
-    
+
     return r if t else 0
 
+def sqrt_mod_prime_cipolla(n:int, p:int) -> int:
+    """
+        For an odd prime number p, either returns x such that x^2 = n mod p, or returns 0 if there's no such x, using Cipolla's algorithm.
+
+        Time complexity: O(log p), independent of the 2-adic valuation of p-1.
+    """
+    if not (n := n%p) or pow(n, (p-1)//2, p) != 1: return 0
+
+    # Find a such that w = a^2 - n is a non quadratic residue, then compute (a + sqrt(w))^((p+1)/2) in F_p[sqrt(w)].
+    a = 1
+    while pow(w := (a*a - n) % p, (p-1)//2, p) != p-1: a += 1
+
+    e, x, y, bx, by = (p+1)//2, 1, 0, a, 1
+    while e:
+        if e&1: x, y = (x*bx + y*by%p*w) % p, (x*by + y*bx) % p
+        bx, by = (bx*bx + by*by%p*w) % p, 2*bx*by % p
+        e >>= 1
+    return x
+
+def sqrt_mod_prime(n:int, p:int) -> int:
+    """
+        For a prime number p, either returns x such that x^2 = n mod p, or returns 0 if there's no such x.
+        
+        The Tonelli-Shanks algorithm is used, unless p-1 is divisible by a large power of two, in which case Cipolla's algorithm is used.
+    """
+
+    if p == 2: return n & 1
+    if not (n := n%p): return 0
+    if (s := sqrt_mod_prime_params(p)[1]) == 1: return r if (r := pow(n, (p+1)//4, p)) * r % p == n else 0
+    if s*s > 20 * p.bit_length(): return sqrt_mod_prime_cipolla(n, p)
+    return sqrt_mod_prime_tonelli_shanks(n, p)
+
+def sqrt_mod_prime_many(ns:list[int], p:int) -> list[int]:
+    """ For a prime number p, returns `[sqrt_mod_prime(n, p) for n in ns]`, sharing per-prime precomputations. """
+    if p == 2: return [n & 1 for n in ns]
+    q, s, _ = sqrt_mod_prime_params(p)
+    if s == 1:
+        e = (p+1)//4
+        return [r if (r := pow(n, e, p)) * r % p == n%p else 0 for n in ns]
+    if s*s > 20 * p.bit_length(): return [sqrt_mod_prime_cipolla(n, p) for n in ns]
+    return [sqrt_mod_prime_tonelli_shanks(n % p, p) if n % p else 0 for n in ns]
+
 def sqrt_mod_prime_power(n:int, p:int, k:int) -> int:
     """
         For a prime number p, either returns x such that x^2 = n mod p^k, or returns 0 if there's no such x.
@@ -0,0 +1,60 @@
+"""
+    Linear sieve for multiplicative functions, given their values on prime powers.
+"""
+
+from typing import Callable
+
+def multiplicative_phi(p: int, k: int) -> int:
+    """ Euler's totient function on `p^k`, for `multiplicative_sieve`. """
+    return (p-1) * p**(k-1)
+
+def multiplicative_mu(p: int, k: int) -> int:
+    """ Mobius function on `p^k`, for `multiplicative_sieve`. """
+    return -1 if k == 1 else 0
+
+def multiplicative_num_divisors(p: int, k: int) -> int:
+    """ Number of divisors of `p^k`, for `multiplicative_sieve`. """
+    return k+1
+
+def multiplicative_sum_divisors(p: int, k: int) -> int:
+    """ Sum of divisors of `p^k`, for `multiplicative_sieve`. """
+    return (p**(k+1) - 1) // (p-1)
+
+def multiplicative_sieve(n: int, f_prime_power: Callable[[int, int], int]) -> tuple[list[int], list[int]]:
+    """
+        Returns `(f, spf)`, where `f[i]` is the value of the multiplicative function f with `f(p^k) = f_prime_power(p, k)`,
+        and `spf[i]` is the smallest prime factor of i, for every `1 <= i <= n`. `f[0]` and `spf[0]` are 0, and `spf[1]` is 1.
+
+        Time complexity: O(n)
+    """
+    f, spf = [0] * (n+1), [0] * (n+1)
+    if n < 1: return f, spf
+    f[1] = spf[1] = 1
+
+    # `rest[i]` is i without its smallest prime factor, i.e. `i // p^k` where p^k exactly divides i.
+    rest = [0] * (n+1)
+    primes = []
+    for i in range(2, n+1):
+        if not spf[i]:
+            spf[i], rest[i], f[i] = i, 1, f_prime_power(i, 1)
+            primes.append(i)
+        si, fi, ri = spf[i], f[i], rest[i]
+        for p in primes:
+            if p > si or (x := i*p) > n: break
+            spf[x] = p
+            if p < si:
+                rest[x], f[x] = i, fi * f[p]
+            elif ri == 1:
+                # x is a prime power.
+                k, y = 1, x
+                while y > p: y //= p; k += 1
+                rest[x], f[x] = 1, f_prime_power(p, k)
+            else:
+                rest[x], f[x] = ri, f[ri] * f[x // ri]
+    return f, spf
+
+def multiplicative_sieve_factor(spf: list[int], n: int):
+    """ Yields every prime factors of `n` in increasing order with repeats, using the smallest-prime-factor table `spf`. """
+    while n > 1:
+        yield (p := spf[n])
+        n //= p
@@ -0,0 +1,104 @@
+"""
+    Sublinear prefix sums of multiplicative functions.
+"""
+
+import itertools, math
+from typing import Callable
+
+from .prime_count import prime_sum_table
+from .prime_sieve import prime_sieve_segmented
+
+def multiplicative_prefix_sum(n: int, f_p: list[int], f_pk: Callable[[int, int], int]) -> int:
+    """
+        Returns `f(1) + f(2) + ... + f(n)` for a multiplicative function f, using Min_25 sieve.
+        f must be a polynomial on primes, `f(p) = sum(f_p[j] * p^j)`, and `f(p^k) = f_pk(p, k)`.
+
+        For example, Euler's totient function can be summed by `multiplicative_prefix_sum(n, [-1, 1], multiplicative_phi)`.
+
+        Time complexity: O(n^(3/4) / log n)
+    """
+    if n < 1: return 0
+    r = math.isqrt(n)
+
+    # Sums of f(p) over primes up to each distinct value of n//i.
+    small, large = [0] * (r+1), [0] * (r+1)
+    for (j, c) in enumerate(f_p):
+        if not c: continue
+        sj, lj = prime_sum_table(n, j)
+        small = [x + c*y for (x, y) in zip(small, sj)]
+        large = [x + c*y for (x, y) in zip(large, lj)]
+
+    primes = prime_sieve_segmented(0, r+1)
+
+    def S(x: int, j: int) -> int:
+        """ Sum of f(i) over `2 <= i <= x` whose smallest prime factor is at least `primes[j]`. """
+        s = (small[x] if x <= r else large[n//x]) - (small[primes[j-1]] if j else 0)
+        for k in range(j, len(primes)):
+            if (p := primes[k]) * p > x: break
+            pe, e = p, 1
+            while pe*p <= x:
+                s += f_pk(p, e) * S(x//pe, k+1) + f_pk(p, e+1)
+                pe *= p
+                e += 1
+        return s
+
+    return S(n, 0) + 1
+
+def dirichlet_hyperbola_sum(n: int, prefix: list[int], h_sum: Callable[[int], int]) -> int:
+    """
+        Returns F(n) for the summatory function F of f, where the summatory function of `f*1` (Dirichlet convolution) is `h_sum`.
+        `prefix[v]` must be F(v) for every `v < len(prefix)`, where `len(prefix) > isqrt(n)`; the optimal length is about `n^(2/3)`.
+
+        F(v) = h_sum(v) - sum(F(v//j) for 2 <= j <= v) is evaluated for each distinct `n//i >= len(prefix)`, from small to large.
+
+        Time complexity: O(n / sqrt(len(prefix)))
+    """
+    lim = len(prefix)
+    if n < lim: return prefix[n]
+    if lim <= math.isqrt(n): raise ValueError("`prefix` must contain F(v) for every v <= isqrt(n).")
+
+    # `large[i]` is F(n//i), for every `n//i >= lim`.
+    K = n // lim
+    large = [0] * (K+1)
+    for i in range(K, 0, -1):
+        v = n//i
+        rv = math.isqrt(v)
+        # Terms with j <= sqrt(v): F(v//j) = F(n//(i*j)).
+        jl = min(rv, K//i)
+        s = sum(large[2*i:jl*i+1:i]) + sum(prefix[v//j] for j in range(max(jl+1, 2), rv+1))
+        # Remaining terms with q = v//j < sqrt(v) are grouped by q.
+        s += sum((v//q - v//(q+1)) * prefix[q] for q in range(1, v//(rv+1)+1))
+        large[i] = h_sum(v) - s
+    return large[1]
+
+def mertens(n: int) -> int:
+    """
+        Returns the Mertens function `M(n) = mu(1) + mu(2) + ... + mu(n)`.
+
+        Time complexity: O(n^(2/3))
+    """
+    if n < 1: return 0
+    lim = max(min(int(n ** (2/3)), 10**7), math.isqrt(n)) + 1
+
+    mu = [1] * lim
+    for p in prime_sieve_segmented(0, lim):
+        mu[p::p] = [-x for x in mu[p::p]]
+        if p*p < lim: mu[p*p::p*p] = [0] * len(range(p*p, lim, p*p))
+    mu[0] = 0
+
+    return dirichlet_hyperbola_sum(n, list(itertools.accumulate(mu)), lambda v: 1)
+
+def totient_sum(n: int) -> int:
+    """
+        Returns `phi(1) + phi(2) + ... + phi(n)`, where phi is Euler's totient function.
+
+        Time complexity: O(n^(2/3))
+    """
+    if n < 1: return 0
+    lim = max(min(int(n ** (2/3)), 10**7), math.isqrt(n)) + 1
+
+    phi = list(range(lim))
+    for p in prime_sieve_segmented(0, lim):
+        phi[p::p] = [x - x//p for x in phi[p::p]]
+
+    return dirichlet_hyperbola_sum(n, list(itertools.accumulate(phi)), lambda v: v*(v+1)//2)
@@ -1,4 +1,6 @@
-from math import isqrt
+import functools
+from bisect import bisect_right
+from math import gcd, isqrt
 
 def is_prime_trial_division(n: int) -> bool:
     """ Primality testing using trial division. Slow but good enough for simple problems. """
@@ -108,4 +110,65 @@ def is_prime(n: int) -> bool:
         (*p23, 29, 31, 37) if n < 318665857834031151167461 else 
         (*p23, 29, 31, 37, 41) if n < 3317044064679887385961981 else 
         (*p23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
-    )
\ No newline at end of file
+    )
+
+@functools.cache
+def is_prime_many_params(bound:int) -> tuple[int, frozenset[int], tuple[int, ...], tuple[tuple[int, ...], ...]]:
+    """
+        Returns `(primorial, small_primes, limits, bases)` used by `is_prime_many`.
+        - `primorial` is the product of all primes less than `bound`, and `small_primes` is the set of those primes.
+        - For `limits[i-1] <= n < limits[i]`, `bases[i]` is a list of bases for a deterministic Miller-Rabin test.
+    """
+    small_primes = frozenset(p for p in range(2, bound) if is_prime_trial_division(p))
+    primorial = 1
+    for p in small_primes: primorial *= p
+
+    p23 = (2, 3, 5, 7, 11, 13, 17, 19, 23)
+    limits = (9080191, 4759123141, 2152302898747, 3474749660383, 341550071728321, 1<<64, 318665857834031151167461, 3317044064679887385961981)
+    bases = (
+        (31, 73), (2, 7, 61), (2, 3, 5, 7, 11), (2, 3, 5, 7, 11, 13), (2, 3, 5, 7, 11, 13, 17),
+        # Deterministic for every n < 2^64 (Sinclair).
+        (2, 325, 9375, 28178, 450775, 9780504, 1795265022),
+        (*p23, 29, 31, 37), (*p23, 29, 31, 37, 41),
+        (*p23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97),
+    )
+    return primorial, small_primes, limits, bases
+
+def is_prime_many(ns:list[int]) -> bytearray:
+    """
+        Returns a bytearray whose i-th element is 1 if `ns[i]` is a prime number, and 0 otherwise.
+
+        Numbers with small prime factors are filtered with a single gcd against a primorial,
+        and the Miller-Rabin test is done for remaining numbers, grouped by the set of bases.
+    """
+    bound = 256
+    primorial, small_primes, limits, bases = is_prime_many_params(bound)
+    bound_sq = bound * bound
+
+    ret = bytearray(len(ns))
+    groups = [[] for _ in bases]
+    for (i, n) in enumerate(ns):
+        if gcd(n, primorial) != 1:
+            if n in small_primes: ret[i] = 1
+        elif n < bound_sq:
+            if n > 1: ret[i] = 1
+        else:
+            groups[bisect_right(limits, n)].append(i)
+
+    for (al, group) in zip(bases, groups):
+        for i in group:
+            n = ns[i]
+            d = n1 = n-1
+            r = (d & -d).bit_length()-1
+            d >>= r
+
+            for a in al:
+                x = pow(a, d, n)
+                if x == 1 or x == n1: continue
+                for _ in range(r-1):
+                    if (x := (x*x)%n) == n1: break
+                else: break
+            else:
+                ret[i] = 1
+
+    return ret
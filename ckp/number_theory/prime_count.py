@@ -0,0 +1,145 @@
+"""
+    Sublinear prime counting and prime sums.
+"""
+
+import bisect, functools, itertools, math
+from fractions import Fraction
+
+from .prime_sieve import prime_sieve_segmented
+
+@functools.cache
+def power_sum_coefficients(k: int) -> tuple[tuple[int, ...], int]:
+    """ Returns `(c, d)` such that `1^k + 2^k + ... + v^k == sum(c[i] * v^i) // d`, using Faulhaber's formula. """
+    bernoulli = [Fraction(1)]
+    for m in range(1, k+1):
+        bernoulli.append(-sum(math.comb(m+1, j) * bernoulli[j] for j in range(m)) / (m+1))
+    if k >= 1: bernoulli[1] = -bernoulli[1]
+
+    coeffs = [Fraction(0)] * (k+2)
+    for j in range(k+1): coeffs[k+1-j] = math.comb(k+1, j) * bernoulli[j] / (k+1)
+
+    d = math.lcm(*(c.denominator for c in coeffs))
+    return tuple(int(c * d) for c in coeffs), d
+
+def power_sum(v: int, k: int) -> int:
+    """ Returns `1^k + 2^k + ... + v^k`, for `v >= 0`. """
+    if k == 0: return v
+    if k == 1: return v*(v+1)//2
+    c, d = power_sum_coefficients(k)
+    s = 0
+    for x in reversed(c): s = s*v + x
+    return s // d
+
+def prime_sum_table(n: int, k: int = 1) -> tuple[list[int], list[int]]:
+    """
+        Returns `(small, large)`, where `small[v]` is the sum of `p^k` over primes `p <= v` for `v <= isqrt(n)`,
+        and `large[i]` is the sum of `p^k` over primes `p <= n//i` for `1 <= i <= isqrt(n)`.
+        Together, they cover every distinct value of `n//i`, as enumerated by `iterate_idiv`.
+
+        This is the Lucy_Hedgehog DP, where each prime p removes numbers whose smallest prime factor is p.
+
+        Time complexity: O(n^(3/4) / log n)
+    """
+    r = math.isqrt(n)
+    small = [0] + [power_sum(v, k) - 1 for v in range(1, r+1)]
+    large = [0] + [power_sum(n//i, k) - 1 for i in range(1, r+1)]
+
+    for p in range(2, r+1):
+        if small[p] == small[p-1]: continue
+        if (p2 := p*p) > n: break
+        sp, pk = small[p-1], p**k
+
+        # S(v) -= p^k * (S(v//p) - S(p-1)), for every v >= p^2. Right-hand sides only refer to values before this update.
+        L = min(r, n//p2)
+        lp = min(L, r//p)
+        if k: large[1:lp+1] = [x - pk*(y - sp) for (x, y) in zip(large[1:lp+1], large[p:lp*p+1:p])]
+        else: large[1:lp+1] = [x - y + sp for (x, y) in zip(large[1:lp+1], large[p:lp*p+1:p])]
+        if lp < L:
+            q = n//p
+            if k: large[lp+1:L+1] = [x - pk*(small[q//i] - sp) for (i, x) in zip(range(lp+1, L+1), large[lp+1:L+1])]
+            else: large[lp+1:L+1] = [x - small[q//i] + sp for (i, x) in zip(range(lp+1, L+1), large[lp+1:L+1])]
+        if p2 <= r:
+            if k: small[p2:] = [x - pk*(small[v//p] - sp) for (v, x) in zip(range(p2, r+1), small[p2:])]
+            else: small[p2:] = [x - small[v//p] + sp for (v, x) in zip(range(p2, r+1), small[p2:])]
+
+    return small, large
+
+def prime_sum(n: int, k: int = 1) -> int:
+    """
+        Returns the sum of `p^k` over primes `p <= n`.
+
+        Time complexity: O(n^(3/4) / log n)
+    """
+    if n < 2: return 0
+    return prime_sum_table(n, k)[1][1]
+
+@functools.cache
+def prime_count_phi_table() -> list[list[int]]:
+    """ Returns t such that `t[a][x]` is the number of `1 <= y <= x` not divisible by first a primes, for `a <= 6` and `x < 30030 = 2*3*5*7*11*13`. """
+    M = 30030
+    phi_table, flags = [list(range(M))], [1] * M
+    flags[0] = 0
+    for p in (2, 3, 5, 7, 11, 13):
+        flags[::p] = bytes(len(range(0, M, p)))
+        phi_table.append(list(itertools.accumulate(flags)))
+    return phi_table
+
+@functools.cache
+def prime_count_primes(lim: int) -> list[int]:
+    """ Returns the list of primes up to lim. Cached for `prime_count_meissel_lehmer`, which only uses few distinct values of lim. """
+    return prime_sieve_segmented(0, lim+1)
+
+def prime_count_meissel_lehmer(n: int) -> int:
+    """
+        Returns the number of primes `p <= n`, using Lehmer's formula.
+        Primes are sieved up to about `max(sqrt(n), min(n^(2/3), 10^7))`.
+        The sieve and the table for small phi values are cached, so repeated queries only redo the counting itself.
+    """
+    if n < 2: return 0
+    # Limits are rounded up to powers of two (except the cap), so that sieves are shared among queries.
+    lim = max(min(1 << int(n ** (2/3)).bit_length(), 10**7), 30030)
+    if lim*lim < n: lim = 1 << math.isqrt(n).bit_length()
+    primes = prime_count_primes(lim)
+
+    M, phi_table = 30030, prime_count_phi_table()
+
+    def phi(x: int, a: int) -> int:
+        """ Number of `1 <= y <= x` not divisible by first a primes. """
+        if a <= 6: return (x//M) * phi_table[a][M-1] + phi_table[a][x%M]
+        if x <= lim and primes[a-1]**2 > x:
+            # Only 1 and primes greater than the a-th prime remain.
+            return bisect.bisect_right(primes, x) - a + 1 if x >= primes[a-1] else min(x, 1)
+        s = phi(x, 6)
+        for i in range(6, a):
+            if x < (p := primes[i]): break
+            s -= phi(x//p, i)
+        return s
+
+    @functools.cache
+    def pi(x: int) -> int:
+        if x <= lim: return bisect.bisect_right(primes, x)
+
+        c3 = round(x ** (1/3))
+        while c3**3 > x: c3 -= 1
+        while (c3+1)**3 <= x: c3 += 1
+        a, b, c = pi(math.isqrt(math.isqrt(x))), pi(math.isqrt(x)), pi(c3)
+
+        s = phi(x, a) + (b+a-2)*(b-a+1)//2
+        for i in range(a, b):
+            w = x // primes[i]
+            s -= pi(w)
+            if i < c:
+                for j in range(i, pi(math.isqrt(w))): s -= pi(w // primes[j]) - j
+        return s
+
+    return pi(n)
+
+def prime_count(n: int) -> int:
+    """
+        Returns the number of primes `p <= n`.
+
+        Lucy_Hedgehog DP is used for small n, and Meissel-Lehmer for larger n; see `bench/number_theory/prime_count.py`.
+    """
+    if n < 2: return 0
+    if n < 10**7: return prime_sum_table(n, 0)[1][1]
+    return prime_count_meissel_lehmer(n)
@@ -95,4 +95,107 @@ def prime_sieve_factor(sieve: PrimeSieveData, n: int):
         yield p
         n //= p
         p = sieve_arr[n//2]
-    if n > 1: yield n
\ No newline at end of file
+    if n > 1: yield n
+
+class CompactPrimeSieveData:
+    """ A primality-only sieve of Eratosthenes, using one byte per odd number. """
+    __slots__ = ('_sieve', '_max_testable_odd')
+    _sieve: bytearray
+    """ `_sieve[k]` is 1 if `2k+1` is a prime number, and 0 otherwise. """
+
+    _max_testable_odd: int
+
+    def __init__(self, max_n: int = 1):
+        self._sieve = bytearray(1)
+        self._max_testable_odd = 1
+
+        if max_n > 1: compact_prime_sieve_extend(self, max_n)
+
+class CompactPrimeSieve(CompactPrimeSieveData):
+    __slots__ = ()
+    def extend(self, max_n: int): compact_prime_sieve_extend(self, max_n)
+    def is_prime(self, n: int) -> bool: return compact_prime_sieve_query(self, n)
+    def primes(self): return compact_prime_sieve_primes(self)
+
+def compact_prime_sieve_init(max_n: int = 1):
+    return CompactPrimeSieveData(max_n)
+
+def compact_prime_sieve_extend(sieve: CompactPrimeSieveData, max_n: int):
+    """ Extend the sieve, so that the primality test up to `max_n` with this sieve becomes possible. """
+    if max_n <= sieve._max_testable_odd+1: return
+
+    sieve_arr, max_testable_odd = sieve._sieve, sieve._max_testable_odd
+    old_len = len(sieve_arr)
+    new_len = (max_n+1) // 2
+
+    sieve_arr.extend(b'\x01' * (new_len - old_len))
+
+    # Primes are visited in increasing order, so `sieve_arr[k]` is final when it's visited.
+    for k in range(1, math.isqrt(new_len*2 - 1)//2 + 1):
+        if not sieve_arr[k]: continue
+        p = k+k+1
+        if (start := p*p//2) < old_len:
+            start = max_testable_odd + 2
+            if (r := start % p): start += p - r
+            if not(start & 1): start += p
+            start //= 2
+        sieve_arr[start::p] = bytes(len(range(start, new_len, p)))
+
+    sieve._max_testable_odd = new_len*2 - 1
+
+def compact_prime_sieve_primes(sieve: CompactPrimeSieveData):
+    """ Yields prime numbers inferable from the sieve. """
+    yield 2
+    sieve_arr = sieve._sieve
+    yield from itertools.compress(range(1, 2*len(sieve_arr), 2), sieve_arr)
+
+def compact_prime_sieve_query(sieve: CompactPrimeSieveData, n: int) -> bool:
+    """
+        Check whether `n` is a prime number, querying `sieve`.
+        When `n` is an odd number, the sieve might get extended.
+    """
+    if not (n&1): return n == 2
+    if n < 2: return False
+    if n > sieve._max_testable_odd: compact_prime_sieve_extend(sieve, n)
+    return sieve._sieve[n // 2] == 1
+
+def prime_sieve_segmented_iter(L: int, R: int, block_size: int = 1<<19):
+    """
+        Yields prime numbers in [L, R) in increasing order, sieving each block of `block_size` integers with primes up to `sqrt(R)`.
+
+        Memory usage: O(sqrt(R) + block_size)
+    """
+    L = max(L, 2)
+    if L >= R: return
+    if L == 2:
+        yield 2
+        L = 3
+
+    # Odd base primes up to sqrt(R-1); `base[k]` is nonzero iff 2k+1 is a prime.
+    r = math.isqrt(R-1)
+    base = bytearray([1]) * (r//2 + 1)
+    base[0] = 0
+    for k in range(1, math.isqrt(r)//2 + 1):
+        if base[k]:
+            p = k+k+1
+            base[p*p//2::p] = bytes(len(range(p*p//2, len(base), p)))
+    base_primes = list(itertools.compress(range(1, 2*len(base), 2), base))
+
+    # Each block only contains odd numbers in [lo, hi); `block[i]` corresponds to lo+2i.
+    block_size += block_size & 1
+    lo = L | 1
+    while lo < R:
+        hi = min(lo + block_size, R)
+        m = (hi - lo + 1) // 2
+        block = bytearray([1]) * m
+        for p in base_primes:
+            if p*p >= hi: break
+            s = max(p*p, (lo + p - 1) // p * p)
+            if not (s & 1): s += p
+            if (i := (s - lo) // 2) < m: block[i::p] = bytes((m - 1 - i) // p + 1)
+        yield from itertools.compress(range(lo, hi, 2), block)
+        lo = hi
+
+def prime_sieve_segmented(L: int, R: int, block_size: int = 1<<19) -> list[int]:
+    """ Returns the list of prime numbers in [L, R), using a segmented sieve. """
+    return list(prime_sieve_segmented_iter(L, R, block_size))
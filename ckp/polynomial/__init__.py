@@ -1 +1,2 @@
-from .polynomial_mod import *
\ No newline at end of file
+from .polynomial_mod import *
+from .linear_recurrence import *
\ No newline at end of file
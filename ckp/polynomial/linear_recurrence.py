@@ -0,0 +1,51 @@
+"""
+    Linear recurrences `a[i] = c[0]*a[i-1] + c[1]*a[i-2] + ... + c[k-1]*a[i-k]` over Z/pZ, for a prime p.
+"""
+
+from .polynomial_mod import poly_mod_mul
+
+def berlekamp_massey(seq:list[int], p:int = 998244353) -> list[int]:
+    """
+        Returns the shortest coefficients c of a linear recurrence satisfied by seq modulo p.
+        At least 2k terms of seq are needed to recover a recurrence of order k.
+
+        Time complexity: O(n^2)
+    """
+    C, B = [1], [1]
+    L, m, b = 0, 1, 1
+    for (n, x) in enumerate(seq):
+        # Discrepancy between seq[n] and the value predicted by the current recurrence.
+        d = (x + sum(C[i] * seq[n-i] for i in range(1, L+1))) % p
+        if not d:
+            m += 1
+            continue
+
+        coef, T = d * pow(b, -1, p) % p, C[:]
+        if len(C) < len(B) + m: C += [0] * (len(B) + m - len(C))
+        C[m:m+len(B)] = [(y - coef*z) % p for (y, z) in zip(C[m:m+len(B)], B)]
+
+        if 2*L <= n: L, B, b, m = n+1-L, T, d, 1
+        else: m += 1
+
+    return [(-y) % p for y in C[1:L+1]]
+
+def linear_recurrence_nth(coeffs:list[int], init:list[int], n:int, p:int = 998244353) -> int:
+    """
+        Returns `a[n] % p`, where `a[i] = sum(coeffs[j] * a[i-1-j] for j in range(k))` and `a[:k] = init`, with `k = len(coeffs)`.
+
+        Time complexity: O(M(k) log n), where M(k) is the time for multiplying polynomials of length k.
+    """
+    k = len(coeffs)
+    if n < len(init): return init[n] % p
+    if k == 0: return 0
+
+    # Bostan-Mori: a[n] = [x^n] P(x)/Q(x), where Q = 1 - sum(coeffs[j] * x^(j+1)) and P = (A*Q) mod x^k.
+    Q = [1] + [(-c) % p for c in coeffs]
+    P = poly_mod_mul(init[:k], Q, p)[:k]
+    while n:
+        # P/Q = P(x)Q(-x) / Q(x)Q(-x), where the denominator only has even terms.
+        Q_neg = [(-c) % p if i%2 else c for (i, c) in enumerate(Q)]
+        P = poly_mod_mul(P, Q_neg, p)[n%2::2]
+        Q = poly_mod_mul(Q, Q_neg, p)[::2]
+        n //= 2
+    return P[0] * pow(Q[0], -1, p) % p
@@ -1 +1,202 @@
-# TODO
\ No newline at end of file
+"""
+    Polynomials and formal power series over Z/pZ, for a prime p.
+    A polynomial is a list of coefficients in [0, p), starting from the constant term.
+
+    Functions taking `n` return the first n terms of a formal power series.
+"""
+
+from ..fourier.convolution import convolve
+from ..fourier.ntt import NTT, convolve_ntt
+from ..fourier.util import min_convolution_size_power
+from ..number_theory.modular_sqrt import sqrt_mod_prime
+
+def poly_mod_mul(a:list[int], b:list[int], p:int = 998244353) -> list[int]:
+    """ Returns the product of polynomials a and b, modulo p. """
+    if not (a and b): return []
+    # Kronecker substitution is faster for short polynomials, see `bench/fourier/convolution.py`.
+    if len(a) + len(b) >= (1<<16) and not ((p-1) % (1 << min_convolution_size_power(a, b))): return convolve_ntt(a, b, p)
+    return [x%p for x in convolve(a, b)]
+
+def poly_mod_derivative(a:list[int], p:int = 998244353) -> list[int]:
+    """ Returns the derivative of a, modulo p. """
+    return [i*x%p for (i, x) in enumerate(a[1:], 1)]
+
+def poly_mod_integral(a:list[int], p:int = 998244353) -> list[int]:
+    """ Returns the integral of a with zero constant term, modulo p. Assumes that `len(a) < p`. """
+    n = len(a)
+    inv = [0, 1]
+    for i in range(2, n+1): inv.append(-(p//i) * inv[p%i] % p)
+    return [0] + [x*y%p for (x, y) in zip(a, inv[1:])]
+
+def poly_mod_inv(a:list[int], n:int, p:int = 998244353) -> list[int]:
+    """ Returns the first n terms of 1/a, modulo p. `a[0]` must not be zero. """
+    if n <= 0: return []
+    if not (a and a[0] % p): raise ValueError("The constant term must be invertible.")
+
+    g = [pow(a[0], -1, p)]
+    while (h := len(g)) < n:
+        k = min(2*h, n)
+        # a*g = 1 + x^h * e (mod x^k), so 1/a = g - x^h * g*e (mod x^k).
+        K = 1 << (k-1).bit_length()
+        if k >= (1<<15) and not ((p-1) % K):
+            # Cyclic convolutions of size K suffice, as wrapped-around terms only affect the first h terms.
+            ntt = NTT.get(K.bit_length()-1, p)
+            fg = ntt(g)
+            e = ntt([x*y%p for (x, y) in zip(ntt(a[:k]), fg)], inverse=True)[h:k]
+            t = ntt([x*y%p for (x, y) in zip(ntt(e), fg)], inverse=True)[:k-h]
+        else:
+            e = poly_mod_mul(a[:k], g, p)[h:k]
+            t = poly_mod_mul(g[:k-h], e, p)[:k-h]
+        g += [(-x)%p for x in t]
+        g += [0] * (k - len(g))
+    return g
+
+def poly_mod_log(a:list[int], n:int, p:int = 998244353) -> list[int]:
+    """ Returns the first n terms of log(a), modulo p. `a[0]` must be 1. """
+    if n <= 0: return []
+    if not a or a[0] % p != 1: raise ValueError("The constant term must be 1.")
+
+    d = poly_mod_mul(poly_mod_derivative(a[:n], p), poly_mod_inv(a, n, p), p)[:n-1]
+    return (poly_mod_integral(d, p) + [0] * n)[:n]
+
+def poly_mod_exp(a:list[int], n:int, p:int = 998244353) -> list[int]:
+    """ Returns the first n terms of exp(a), modulo p. `a[0]` must be zero. """
+    if n <= 0: return []
+    if a and a[0] % p: raise ValueError("The constant term must be zero.")
+
+    g = [1]
+    while (h := len(g)) < n:
+        k = min(2*h, n)
+        # g <- g * (1 - log(g) + a)
+        d = poly_mod_log(g, k, p)
+        d = [(x-y)%p for (x, y) in zip(a[:k] + [0] * (k - len(a)), d)]
+        d[0] = (d[0] + 1) % p
+        g = poly_mod_mul(g, d, p)[:k]
+    return g
+
+def poly_mod_sqrt(a:list[int], n:int, p:int = 998244353) -> list[int]|None:
+    """ Returns the first n terms of a square root of a modulo p, or None if there's no square root. """
+    if n <= 0: return []
+
+    s = 0
+    while s < len(a) and not (a[s] % p): s += 1
+    if s == len(a) or s >= 2*n: return [0] * n
+    if s % 2: return None
+
+    a = a[s:]
+    if (g0 := 1 if a[0] % p == 1 else sqrt_mod_prime(a[0] % p, p)) == 0: return None
+
+    m, inv2 = n - s//2, (p+1)//2
+    g = [g0]
+    while (h := len(g)) < m:
+        k = min(2*h, m)
+        # g <- (g + a/g) / 2
+        t = poly_mod_mul(a[:k], poly_mod_inv(g, k, p), p)[:k]
+        g = [(x+y)*inv2%p for (x, y) in zip(g + [0] * (k-h), t + [0] * (k-len(t)))]
+    return [0] * (s//2) + g
+
+def poly_mod_pow(a:list[int], k:int, n:int, p:int = 998244353) -> list[int]:
+    """ Returns the first n terms of a^k modulo p, for an integer k >= 0. """
+    if n <= 0: return []
+    if k == 0: return [1] + [0] * (n-1)
+
+    s = 0
+    while s < len(a) and not (a[s] % p): s += 1
+    if s == len(a) or s*k >= n: return [0] * n
+
+    # a = c * x^s * b where b[0] = 1, and a^k = c^k * x^(sk) * exp(k*log(b)).
+    c = a[s] % p
+    inv_c, m = pow(c, -1, p), n - s*k
+    b = [x*inv_c%p for x in a[s:s+m]]
+    l = poly_mod_log(b, m, p)
+    k_mod, ck = k%p, pow(c, k, p)
+    g = poly_mod_exp([x*k_mod%p for x in l], m, p)
+    return [0] * (s*k) + [x*ck%p for x in g]
+
+def poly_mod_divmod(a:list[int], b:list[int], p:int = 998244353) -> tuple[list[int], list[int]]:
+    """
+        Returns (q, r) such that a = b*q + r modulo p, where `len(r) < len(b)`.
+        The last coefficient of b must not be zero. r has exactly `min(len(a), len(b)-1)` terms.
+    """
+    n, m = len(a), len(b)
+    if not (m and b[-1] % p): raise ValueError("The leading coefficient must be invertible.")
+    if n < m: return [], [x%p for x in a]
+
+    k = n-m+1
+    if min(k, m) <= 64:
+        # Schoolbook long division.
+        r = [x%p for x in a]
+        q = [0] * k
+        inv_lead = pow(b[-1], -1, p)
+        for i in range(k-1, -1, -1):
+            if not (c := r[i+m-1] * inv_lead % p): continue
+            q[i] = c
+            r[i:i+m] = [(x - c*y)%p for (x, y) in zip(r[i:i+m], b)]
+        return q, r[:m-1]
+
+    # The reversal of q is the first k terms of rev(a)/rev(b).
+    q = poly_mod_mul(a[:n-k-1:-1], poly_mod_inv(b[::-1], k, p), p)[k-1::-1]
+    r = [(x-y)%p for (x, y) in zip(a[:m-1], poly_mod_mul(b[:m-1], q[:m-1], p))]
+    return q, r
+
+def poly_mod_subproduct_tree(xs:list[int], p:int = 998244353) -> list[list[list[int]]]:
+    """
+        Returns the subproduct tree of xs modulo p, as a list of levels.
+        Level 0 contains `x - xs[i]`, and each node of level k+1 is the product of two adjacent nodes in level k.
+    """
+    level = [[(-x)%p, 1] for x in xs]
+    tree = [level]
+    while len(level) > 1:
+        level = [poly_mod_mul(level[i], level[i+1], p) if i+1 < len(level) else level[i] for i in range(0, len(level), 2)]
+        tree.append(level)
+    return tree
+
+def poly_mod_multipoint_evaluate(a:list[int], xs:list[int], p:int = 998244353, tree:list[list[list[int]]]|None = None) -> list[int]:
+    """
+        Returns `[a(x) % p for x in xs]`, using the subproduct tree of xs (computed when `tree` is not given).
+
+        Time complexity: O(n log^2 n)
+    """
+    if not xs: return []
+    if tree is None: tree = poly_mod_subproduct_tree(xs, p)
+
+    # Go down the remainder tree, until nodes become small enough for Horner's method.
+    rems = [poly_mod_divmod(a, tree[-1][0], p)[1]]
+    k = len(tree) - 1
+    while k > 6:
+        k -= 1
+        level = tree[k]
+        rems = [poly_mod_divmod(rems[i//2], level[i], p)[1] for i in range(len(level))]
+
+    ret = []
+    for (i, r) in enumerate(rems):
+        r = r[::-1]
+        for x in xs[i<<k:(i+1)<<k]:
+            v = 0
+            for c in r: v = (v*x + c) % p
+            ret.append(v)
+    return ret
+
+def poly_mod_interpolate(xs:list[int], ys:list[int], p:int = 998244353, tree:list[list[list[int]]]|None = None) -> list[int]:
+    """
+        Returns the polynomial a with `len(xs)` terms such that `a(xs[i]) = ys[i]` modulo p, for distinct xs.
+        The subproduct tree of xs is reused when `tree` is given.
+
+        Time complexity: O(n log^2 n)
+    """
+    if not xs: return []
+    if tree is None: tree = poly_mod_subproduct_tree(xs, p)
+
+    # Lagrange interpolation: a = sum(ys[i] / M'(xs[i]) * M/(x - xs[i])), where M is the product of all (x - xs[i]).
+    ds = poly_mod_multipoint_evaluate(poly_mod_derivative(tree[-1][0], p), xs, p, tree)
+    level = [[y * pow(d, -1, p) % p] for (y, d) in zip(ys, ds)]
+
+    for k in range(len(tree)-1):
+        nodes = tree[k]
+        level = [
+            [(x+y)%p for (x, y) in zip(poly_mod_mul(level[i], nodes[i+1], p), poly_mod_mul(level[i+1], nodes[i], p))]
+            if i+1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ]
+
+    return (level[0] + [0] * len(xs))[:len(xs)]
@@ -9,4 +9,5 @@ from .misc import *
 from .nimber import *
 from .number_theory import *
 from .numeric import *
+from .polynomial import *
 from .string import *
\ No newline at end of file
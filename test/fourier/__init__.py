@@ -1,2 +1,5 @@
 from .complex import *
+from .convolution import *
+from .ntt import *
+from .online_convolution import *
 from .util import *
\ No newline at end of file
@@ -1,5 +1,5 @@
 
-import unittest
+import unittest, random
 from ckp.fourier.complex import *
 
 class TestComplexNaiveDFT(unittest.TestCase):
@@ -32,4 +32,114 @@ class TestComplexCooleyTukeyFFT(unittest.TestCase):
         for i in range(len(fft)): fx[i] *= fy[i]
         z = fft(fx, inverse=True)
         
-        self.assertEqual(max(round(abs(x)) for x in z), 28886)
\ No newline at end of file
+        self.assertEqual(max(round(abs(x)) for x in z), 28886)
+
+class TestFFTRealPair(unittest.TestCase):
+    def test_random(self):
+        for n in (1, 2, 8, 256):
+            x = [random.uniform(-1, 1) for _ in range(random.randint(1, n))]
+            y = [random.uniform(-1, 1) for _ in range(random.randint(1, n))]
+            fx, fy = fft_real_pair(x, y, n)
+            dft = get_complex_dft(n)
+            for (u, v) in zip(fx, dft(x)): self.assertAlmostEqual(u, v)
+            for (u, v) in zip(fy, dft(y)): self.assertAlmostEqual(u, v)
+
+class TestConvolveReal(unittest.TestCase):
+    def test_random(self):
+        from ckp.fourier.util import convolve_naive
+        for _ in range(30):
+            a = [random.randint(-1000, 1000) for _ in range(random.randint(1, 300))]
+            b = [random.randint(-1000, 1000) for _ in range(random.randint(1, 300))]
+            c = convolve_real(a, b)
+            self.assertListEqual([round(x) for x in c], convolve_naive(a, b))
+
+class TestComplexRadix4FFT(unittest.TestCase):
+    def test_correlation(self):
+        x = [23, 4, 95, 20, 17, 94, 63, 44, 13, 96] * 2
+        y = [87, 54, 13, 18, 61, 24, 17, 94, 53, 2][::-1]
+
+        fft = ComplexRadix4FFT.get_common_fft(x, y)
+        self.assertEqual(len(fft), 32)
+        fx, fy = fft(x), fft(y)
+        for i in range(len(fft)): fx[i] *= fy[i]
+        z = fft(fx, inverse=True)
+
+        self.assertEqual(max(round(abs(x)) for x in z), 28886)
+
+    def test_against_radix_2(self):
+        for L in range(12):
+            x = [complex(random.random(), random.random()) for _ in range(1<<L)]
+            fft = get_complex_dft(1<<L, radix=4)
+            for (u, v) in zip(fft(x), ComplexCooleyTukeyFFT.get(L)(x)): self.assertAlmostEqual(u, v)
+            for (u, v) in zip(fft(fft(x), inverse=True), x): self.assertAlmostEqual(u, v)
+
+    def test_invalid_radix(self):
+        with self.assertRaises(ValueError): get_complex_dft(16, radix=3)
+
+class TestComplexDFTOutBuffer(unittest.TestCase):
+    def test_out(self):
+        for dft in (ComplexNaiveDFT(16), ComplexCooleyTukeyFFT.get(4), ComplexRadix4FFT.get(4), ComplexRadix4FFT.get(5)):
+            N = len(dft)
+            x = [complex(random.random(), random.random()) for _ in range(N - 3)]
+            expected = dft(x)
+
+            out = [0] * N
+            self.assertIs(dft(x, out=out), out, f"{dft}")
+            for (u, v) in zip(out, expected): self.assertAlmostEqual(u, v)
+
+            y = x[:]
+            self.assertIs(dft(y, out=y), y, f"{dft}")
+            self.assertEqual(len(y), N)
+            for (u, v) in zip(y, expected): self.assertAlmostEqual(u, v)
+
+            self.assertIs(dft(y, inverse=True, out=y), y, f"{dft}")
+            for (u, v) in zip(y, x + [0]*3): self.assertAlmostEqual(u, v)
+
+    def test_out_buffer_alias(self):
+        dft = ComplexNaiveDFT(8)
+        x = [complex(random.random(), random.random()) for _ in range(8)]
+        out = [0] * 8
+        self.assertIs(dft(x, out), out)
+        for (u, v) in zip(out, dft(x)): self.assertAlmostEqual(u, v)
+
+class TestComplexDFTTransformMany(unittest.TestCase):
+    def test_against_loop(self):
+        for dft in (ComplexNaiveDFT(6), ComplexCooleyTukeyFFT.get(4), ComplexRadix4FFT.get(5), get_complex_dft(10), get_complex_dft(100, 4)):
+            N = len(dft)
+            xs = [[complex(random.random(), random.random()) for _ in range(random.randint(0, N+2))] for _ in range(5)]
+            for inverse in (False, True):
+                ys = dft.transform_many(xs, inverse=inverse)
+                self.assertEqual(len(ys), len(xs))
+                for (x, y) in zip(xs, ys):
+                    self.assertEqual(len(y), N)
+                    for (u, v) in zip(y, dft(x, inverse=inverse)): self.assertAlmostEqual(u, v)
+
+            outs = [[0] * (N+1) for _ in xs]
+            self.assertIs(dft.transform_many(xs, out=outs), outs)
+            for (x, o) in zip(xs, outs):
+                for (u, v) in zip(o, dft(x)): self.assertAlmostEqual(u, v)
+            self.assertListEqual(dft.transform_many([]), [])
+
+class TestComplexBluesteinDFT(unittest.TestCase):
+    def test_against_naive(self):
+        for n in (3, 5, 6, 7, 12, 100, 257):
+            for radix in (2, 4):
+                dft = get_complex_dft(n, radix)
+                self.assertIsInstance(dft, ComplexBluesteinDFT)
+                self.assertEqual(len(dft), n)
+
+                naive = ComplexNaiveDFT(n)
+                x = [complex(random.random(), random.random()) for _ in range(n)]
+                for (u, v) in zip(dft(x), naive(x)): self.assertAlmostEqual(u, v)
+                for (u, v) in zip(dft(x, inverse=True), naive(x, inverse=True)): self.assertAlmostEqual(u, v)
+
+    def test_cyclic_convolution(self):
+        x = [23, 4, 95, 20, 17, 94, 63, 44, 13, 96]
+        y = [87, 54, 13, 18, 61, 24, 17, 94, 53, 2]
+
+        dft = get_complex_dft(10)
+        fx, fy = dft(x), dft(y)
+        z = dft([a*b for (a, b) in zip(fx, fy)], inverse=True)
+        self.assertEqual(len(z), 10)
+        for k in range(10):
+            self.assertAlmostEqual(z[k], sum(x[i] * y[(k-i)%10] for i in range(10)), places=6)
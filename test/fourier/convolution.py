@@ -0,0 +1,69 @@
+import unittest
+from ckp.fourier.convolution import *
+
+import random
+from ckp.fourier.util import convolve_naive
+from ckp.number_theory.primality_test import is_prime
+
+class TestConvolutionNTTPrimes(unittest.TestCase):
+    def test(self):
+        primes = convolution_ntt_primes(30)
+        self.assertEqual(primes[:3], (998244353, 469762049, 167772161))
+        self.assertEqual(len(set(primes)), 30)
+        for p in primes:
+            self.assertTrue(is_prime(p), f"{p} is not a prime number")
+            self.assertEqual((p-1) % (1<<23), 0, f"{p} is not NTT-friendly")
+
+class TestConvolveMod(unittest.TestCase):
+    def test_random(self):
+        for m in (10**9+7, 2, 998244353, 2**61-1, 10**30):
+            for _ in range(10):
+                a = [random.randrange(m) for _ in range(random.randint(1, 150))]
+                b = [random.randrange(m) for _ in range(random.randint(1, 150))]
+                self.assertListEqual(convolve_mod(a, b, m), [x%m for x in convolve_naive(a, b)], f"{m=}")
+
+    def test_large(self):
+        m = 10**9+7
+        a = [m-1] * 3000
+        self.assertEqual(convolve_mod(a, a, m)[2999], 3000 % m)
+
+class TestConvolveExact(unittest.TestCase):
+    def test_random(self):
+        for bits in (1, 30, 64, 200):
+            for _ in range(10):
+                a = [random.randint(-(1<<bits), 1<<bits) for _ in range(random.randint(1, 150))]
+                b = [random.randint(0, 1<<bits) for _ in range(random.randint(1, 150))]
+                self.assertListEqual(convolve_exact(a, b), convolve_naive(a, b), f"{bits=}")
+
+    def test_zero(self):
+        self.assertListEqual(convolve_exact([0]*50, [0]*40), [0]*89)
+        self.assertListEqual(convolve_exact([], [1]), [])
+
+class TestConvolveKronecker(unittest.TestCase):
+    def test_random(self):
+        for bits in (1, 8, 30, 64, 200):
+            for _ in range(10):
+                a = [random.randint(0, 1<<bits) for _ in range(random.randint(1, 150))]
+                b = [random.randint(0, 1<<bits) for _ in range(random.randint(1, 150))]
+                self.assertListEqual(convolve_kronecker(a, b), convolve_naive(a, b), f"{bits=}")
+
+                a = [random.randint(-(1<<bits), 1<<bits) for _ in range(random.randint(1, 150))]
+                self.assertListEqual(convolve_kronecker(a, b), convolve_naive(a, b), f"{bits=}")
+                self.assertListEqual(convolve_kronecker(b, a), convolve_naive(b, a), f"{bits=}")
+
+    def test_bound(self):
+        a, b = [3, -1, 4], [1, 5, -9, 2]
+        self.assertListEqual(convolve_kronecker(a, b, 100), convolve_naive(a, b))
+
+    def test_zero(self):
+        self.assertListEqual(convolve_kronecker([0]*5, [0]*4), [0]*8)
+        self.assertListEqual(convolve_kronecker([], [1]), [])
+
+class TestConvolve(unittest.TestCase):
+    def test_random(self):
+        for (n, bits) in ((10, 30), (100, 1), (100, 10), (100, 30), (100, -30), (1000, 8), (3000, 60)):
+            lo = -(1<<-bits) if bits < 0 else 0
+            hi = 1<<abs(bits)
+            a = [random.randint(lo, hi) for _ in range(n)]
+            b = [random.randint(lo, hi) for _ in range(random.randint(1, n))]
+            self.assertListEqual(convolve(a, b), convolve_naive(a, b), f"{n=}, {bits=}")
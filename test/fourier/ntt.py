@@ -0,0 +1,84 @@
+import unittest
+from ckp.fourier.ntt import *
+
+import random
+
+def convolve_naive(a, b, p):
+    c = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b): c[i+j] += x*y
+    return [z%p for z in c]
+
+class TestNTT(unittest.TestCase):
+    def test_inverse(self):
+        for p in (998244353, 469762049, 167772161, 7340033, 257):
+            for L in range(0, 8):
+                ntt = NTT.get(L, p)
+                self.assertEqual(len(ntt), 1<<L)
+                x = [random.randrange(p) for _ in range(1<<L)]
+                self.assertListEqual(ntt(ntt(x), inverse=True), x, f"{p=}, {L=}")
+
+    def test_dft(self):
+        p = 998244353
+        ntt = NTT.get(4, p)
+        w = pow(ntt_root_base(p), (p-1)//16, p)
+        x = [random.randrange(p) for _ in range(16)]
+        expected = [sum(x[n] * pow(w, n*k, p) for n in range(16)) % p for k in range(16)]
+        self.assertListEqual(ntt(x), expected)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError): NTT(9, 257)
+
+    def test_correlation(self):
+        x = [23, 4, 95, 20, 17, 94, 63, 44, 13, 96] * 2
+        y = [87, 54, 13, 18, 61, 24, 17, 94, 53, 2][::-1]
+
+        ntt = NTT.get_common_ntt(x, y)
+        self.assertEqual(len(ntt), 32)
+        fx, fy = ntt(x), ntt(y)
+        z = ntt([a*b for (a, b) in zip(fx, fy)], inverse=True)
+
+        self.assertEqual(max(z), 28886)
+
+class TestConvolveNTT(unittest.TestCase):
+    def test_random(self):
+        for p in (998244353, 469762049, 167772161):
+            for _ in range(30):
+                a = [random.randrange(p) for _ in range(random.randint(1, 100))]
+                b = [random.randrange(p) for _ in range(random.randint(1, 100))]
+                self.assertListEqual(convolve_ntt(a, b, p), convolve_naive(a, b, p))
+
+    def test_empty(self):
+        self.assertListEqual(convolve_ntt([], [1, 2, 3]), [])
+
+class TestNTTOutBuffer(unittest.TestCase):
+    def test_out(self):
+        p = 998244353
+        ntt = NTT.get(5, p)
+        x = [random.randrange(p) for _ in range(30)]
+        expected = ntt(x)
+
+        out = [0] * 40
+        self.assertIs(ntt(x, out=out), out)
+        self.assertListEqual(out[:32], expected)
+
+        y = x[:]
+        self.assertIs(ntt(y, out=y), y)
+        self.assertListEqual(y, expected)
+
+        self.assertIs(ntt(y, inverse=True, out=y), y)
+        self.assertListEqual(y, x + [0, 0])
+
+    def test_transform_many(self):
+        p = 998244353
+        for L in (0, 3, 6, 13):
+            ntt = NTT.get(L, p)
+            N = len(ntt)
+            xs = [[random.randrange(p) for _ in range(random.randint(0, N+2))] for _ in range(7)]
+            for inverse in (False, True):
+                ys = ntt.transform_many(xs, inverse=inverse)
+                self.assertListEqual(ys, [ntt(x[:N], inverse=inverse) for x in xs])
+
+            outs = [[0] * N for _ in xs]
+            self.assertIs(ntt.transform_many(xs, out=outs), outs)
+            self.assertListEqual(outs, [ntt(x[:N]) for x in xs])
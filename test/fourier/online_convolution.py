@@ -0,0 +1,30 @@
+import unittest
+from ckp.fourier.online_convolution import *
+
+import random
+from ckp.fourier.util import convolve_naive
+
+class TestOnlineConvolution(unittest.TestCase):
+    def test_random(self):
+        for modulus in (None, 998244353, 10**9+7):
+            for n in (1, 2, 7, 64, 300):
+                f = [random.randint(0, 10**9) for _ in range(n)]
+                g = [random.randint(0, 10**9) for _ in range(random.randint(0, n+5))]
+                expected = convolve_naive(f, g) if g else [0] * n
+
+                conv = OnlineConvolution(g, modulus)
+                for i in range(n):
+                    h = conv.push(f[i])
+                    self.assertEqual(h, expected[i] if modulus is None else expected[i] % modulus, f"{modulus=}, {n=}, {i=}")
+                self.assertEqual(len(conv), n)
+
+    def test_recurrence(self):
+        # f[i] = sum(f[j] * 2^(i-j) for j < i) with f[0] = 1 gives f[i] = 2 * 4^(i-1) for i >= 1.
+        g = [2**i for i in range(200)]
+        conv = online_convolution_init(g)
+        f = [1]
+        online_convolution_push(conv, 1)
+        for i in range(1, 200):
+            f.append(online_convolution_pending(conv))
+            online_convolution_push(conv, f[-1])
+        self.assertListEqual(f[1:], [2 * 4**(i-1) for i in range(1, 200)])
@@ -32,4 +32,11 @@ class TestBitReverseTable(unittest.TestCase):
                     j = j*2 + ti%2
                     ti //= 2
                 
-                self.assertEqual(j, i, f"double reversal for {L=}, {i=}")
\ No newline at end of file
+                self.assertEqual(j, i, f"double reversal for {L=}, {i=}")
+
+class TestConvolveNaive(unittest.TestCase):
+    def test(self):
+        self.assertListEqual(convolve_naive([1, 2, 3], [4, 5]), [4, 13, 22, 15])
+        self.assertListEqual(convolve_naive([4, 5], [1, 2, 3]), [4, 13, 22, 15])
+        self.assertListEqual(convolve_naive([0, -1], [1]), [0, -1])
+        self.assertListEqual(convolve_naive([], [1]), [])
@@ -1,8 +1,14 @@
 from .arithmetic import *
+from .binomial import *
+from .discrete_log import *
 from .factor import *
+from .floor_sum import *
 from .mobius import *
 from .misc import *
 from .modular import *
 from .modular_sqrt import *
+from .multiplicative_sieve import *
+from .multiplicative_sum import *
 from .primality_test import *
+from .prime_count import *
 from .prime_sieve import *
\ No newline at end of file
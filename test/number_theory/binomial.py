@@ -0,0 +1,38 @@
+import unittest
+from ckp.number_theory.binomial import *
+
+import math
+
+class TestBinomialTable(unittest.TestCase):
+    def test_small(self):
+        for p in (7, 13, 998244353):
+            table = BinomialTable(1, p)
+            for n in range(0, min(p, 60)):
+                for k in range(-1, n+2):
+                    self.assertEqual(table.comb(n, k), math.comb(n, k) % p if 0 <= k <= n else 0, f"testing comb({n}, {k}) mod {p}")
+                    self.assertEqual(table.perm(n, k), math.perm(n, k) % p if 0 <= k <= n else 0, f"testing perm({n}, {k}) mod {p}")
+                if 2*n < p: self.assertEqual(table.catalan(n), math.comb(2*n, n) // (n+1) % p, f"testing catalan({n}) mod {p}")
+
+    def test_catalan_fresh(self):
+        for p in (7, 998244353):
+            self.assertEqual(BinomialTable(0, p).catalan(0), 1)
+            self.assertEqual(BinomialTable(0, p).catalan(1), 1)
+            self.assertEqual(BinomialTable(1, p).catalan(0), 1)
+
+    def test_multinomial(self):
+        table = BinomialTable()
+        self.assertEqual(table.multinomial([]), 1)
+        self.assertEqual(table.multinomial([2, 3, 4]), 1260)
+        self.assertEqual(table.multinomial([100, 200, 300]), math.factorial(600) // (math.factorial(100) * math.factorial(200) * math.factorial(300)) % 998244353)
+
+    def test_lazy(self):
+        table = binomial_table_init(10)
+        self.assertEqual(binomial_table_comb(table, 1000, 500), math.comb(1000, 500) % 998244353)
+        self.assertGreater(len(table.fact), 1000)
+        self.assertEqual(len(table.fact), len(table.inv_fact))
+        for i in range(len(table.fact)): self.assertEqual(table.fact[i] * table.inv_fact[i] % 998244353, 1)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError): BinomialTable(7, 7)
+        table = BinomialTable(3, 7)
+        with self.assertRaises(ValueError): table.comb(10, 3)
@@ -0,0 +1,52 @@
+import unittest
+from ckp.number_theory.discrete_log import *
+
+import math, random
+from ckp.number_theory.primality_test import is_prime
+
+def discrete_log_naive(g, h, m):
+    v = 1 % m
+    for x in range(2*m + 2):
+        if v == h % m: return x
+        v = v * g % m
+    return -1
+
+class TestPrimitiveRoot(unittest.TestCase):
+    def test_small(self):
+        for p in filter(is_prime, range(2, 300)):
+            g = primitive_root(p)
+            self.assertEqual(len({pow(g, i, p) for i in range(p-1)}), p-1, f"testing primitive_root({p})")
+            for c in range(1, g): self.assertLess(len({pow(c, i, p) for i in range(p-1)}), p-1, f"testing primitive_root({p})")
+
+    def test_large(self):
+        self.assertEqual(primitive_root(998244353), 3)
+        self.assertEqual(primitive_root(10**9+7), 5)
+
+class TestMultiplicativeOrder(unittest.TestCase):
+    def test(self):
+        for m in range(1, 100):
+            for a in range(1, m):
+                if math.gcd(a, m) != 1: continue
+                k = 1
+                while pow(a, k, m) != 1 % m: k += 1
+                self.assertEqual(multiplicative_order(a, m), k, f"testing order of {a} mod {m}")
+
+class TestDiscreteLog(unittest.TestCase):
+    def test_small(self):
+        for m in range(1, 60):
+            for g in range(0, m+1):
+                for h in range(0, m):
+                    self.assertEqual(discrete_log(g, h, m), discrete_log_naive(g, h, m), f"testing discrete_log({g}, {h}, {m})")
+
+    def test_large(self):
+        for (g, m) in ((3, 998244353), (5, 10**9+7), (37, 2**61-1), (3, 2**40), (2, 10**18)):
+            n = 2**38 if m == 2**40 else m
+            for _ in range(10):
+                x = random.randrange(min(n, 10**12))
+                y = discrete_log(g, pow(g, x, m), m)
+                self.assertEqual(pow(g, y, m), pow(g, x, m))
+                self.assertLessEqual(y, x)
+
+    def test_none(self):
+        self.assertEqual(discrete_log(4, 3, 7), -1)
+        self.assertEqual(discrete_log(2, 3, 998244353 * 4), -1)
@@ -39,9 +39,46 @@ class TestFactorPollardRho(unittest.TestCase):
                     prod *= p
                 self.assertEqual(prod, n**k)
 
+class TestPollardRhoBrent(unittest.TestCase):
+    def test(self):
+        for (p, q) in ((1000003, 1000033), (3250204337, 9181271329), (1854622803871, 1854622803871), (2, 1000000007), (999983, 999983)):
+            n, start = p*q, 2
+            while not (d := pollard_rho_brent_find_divisor(n, start)): start += 1
+            self.assertIn(d, (p, q), f"finding a divisor of {n}")
+
+    def test_small_batch(self):
+        for n in range(4, 3000):
+            if is_prime(n): continue
+            start = 2
+            while not (d := pollard_rho_brent_find_divisor(n, start, batch=3)): start += 1
+            self.assertTrue(1 < d < n and n % d == 0, f"finding a divisor of {n}")
+
 class TestFactor(unittest.TestCase):
     def test_example(self):
         self.assertListEqual(sorted(factor(29841007892689553873)), [3250204337, 9181271329])
+        self.assertListEqual(sorted(factor(1854622803871**2 * 1000003)), [1000003, 1854622803871, 1854622803871])
+
+class TestFactorMany(unittest.TestCase):
+    def test(self):
+        ns = list(range(-3, 5000)) + [2**61-1, (2**31-1) * (2**61-1), 1854622803871**2 * 12, 10**18, 999983 * 1000003 * 4]
+        for (n, factors) in zip(ns, factor_many(ns)):
+            self.assertListEqual(factors, sorted(factor(n)), f"factoring {n=}")
+
+    def test_sieve_limit(self):
+        cache = factor_cache_init(sieve_limit=100)
+        ns = list(range(1, 3000))
+        for (n, factors) in zip(ns, factor_many(ns, cache)):
+            self.assertListEqual(factors, sorted(factor(n)), f"factoring {n=}")
+
+    def test_memo(self):
+        cache = FactorCache(memo_size=3)
+        for n in (12, 10**18, 12, 35, 77, 10**18, 1001): cache.factor(n)
+        self.assertListEqual(list(cache.memo), [77, 10**18, 1001])
+        self.assertListEqual(cache.factor(10**18), [2]*18 + [5]*18)
+
+        factors = cache.factor(77)
+        factors.append(0)
+        self.assertListEqual(cache.factor(77), [7, 11])
 
 class TestDivisors(unittest.TestCase):
     def test_common(self):
@@ -0,0 +1,41 @@
+import unittest, random
+from ckp.number_theory.floor_sum import *
+from ckp.number_theory.modular import sum_floor_linear
+
+class TestUniversalEuclid(unittest.TestCase):
+    def test_path(self):
+        concat = lambda x, y: x+y
+        for _ in range(1000):
+            a, b, m, n = random.randint(0, 30), random.randint(0, 30), random.randint(1, 20), random.randint(0, 30)
+            path, prev = [], 0
+            for x in range(n):
+                f = (a*x + b) // m
+                path.append('U' * (f-prev) + 'R')
+                prev = f
+            self.assertEqual(universal_euclid(a, b, m, n, 'U', 'R', concat, ''), ''.join(path), f"{a=}, {b=}, {m=}, {n=}")
+
+    def test_floor_sum(self):
+        op = lambda A, B: (A[0]+B[0], A[1]+B[1], A[2]+B[2]+A[0]*B[1])
+        for (a, b, m, n) in [(3, 5, 7, 100), (10**18+3, 12345, 998244353, 10**18), (2**500+1, 3, 3**300, 10**150)]:
+            self.assertEqual(universal_euclid(a, b, m, n, (1, 0, 0), (0, 1, 0), op, (0, 0, 0))[2], sum_floor_linear(a, b, m, n))
+
+    def test_invalid(self):
+        op = lambda x, y: x+y
+        for (a, b, m) in [(-1, 0, 1), (0, -1, 1), (1, 1, 0)]:
+            with self.assertRaises(ValueError): universal_euclid(a, b, m, 10, 'U', 'R', op, '')
+
+class TestSumFloorLinearTable(unittest.TestCase):
+    def test_random(self):
+        for _ in range(1000):
+            a, b = random.randint(-60, 60), random.randint(-60, 60)
+            while (m := random.randint(-30, 30)) == 0: pass
+            n, k1, k2 = random.randint(0, 40), random.randint(0, 3), random.randint(0, 3)
+            t = sum_floor_linear_table(a, b, m, n, k1, k2)
+            for i in range(k1+1):
+                for j in range(k2+1):
+                    self.assertEqual(t[i][j], sum(x**i * ((a*x + b)//m)**j for x in range(n)), f"{a=}, {b=}, {m=}, {n=}, {i=}, {j=}")
+
+    def test_power(self):
+        for (a, b, m, n) in [(3, 5, 7, 1000), (-17, 1000, 13, 500), (123456, -7, -1000, 777)]:
+            self.assertEqual(sum_floor_linear_power(a, b, m, n, 0, 1), sum_floor_linear(a, b, m, n))
+            self.assertEqual(sum_floor_linear_power(a, b, m, n, 1, 2), sum(x * ((a*x + b)//m)**2 for x in range(n)))
@@ -63,6 +63,38 @@ class TestCombModPrime(unittest.TestCase):
 
                     self.assertEqual(comb_mod_prime(n, k, p), nCk % p, f"C({n}, {k}) % {p}")
 
+class TestBatchInverse(unittest.TestCase):
+    def test(self):
+        self.assertListEqual(batch_inverse([], 7), [])
+        self.assertListEqual(batch_inverse([1, 2, 3, 4, 5, 6], 7), [1, 4, 5, 2, 3, 6])
+        for m in (998244353, 10**9+7, 10**18):
+            xs = [x for x in (random.randrange(1, m) for _ in range(1000)) if math.gcd(x, m) == 1]
+            self.assertListEqual(batch_inverse(xs, m), [pow(x, -1, m) for x in xs])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError): batch_inverse([1, 2, 0, 3], 7)
+
+class TestCombMod(unittest.TestCase):
+    def test_small(self):
+        for m in list(range(1, 130)) + [1024, 3**7, 2**20, 10**9+7, 998244353*8, 1009**2, 2**10 * 3**5 * 7]:
+            for n in range(0, 40):
+                for k in range(-1, n+2):
+                    self.assertEqual(comb_mod(n, k, m), math.comb(n, k) % m if 0 <= k <= n else 0, f"testing comb({n}, {k}) mod {m}")
+
+    def test_prime_power(self):
+        for (p, e) in ((2, 30), (3, 13), (1009, 3), (10007, 2)):
+            for _ in range(30):
+                n = random.randrange(0, 3000)
+                k = random.randrange(0, n+1)
+                self.assertEqual(comb_mod_prime_power(n, k, p, e), math.comb(n, k) % p**e, f"testing comb({n}, {k}) mod {p}^{e}")
+
+    def test_large(self):
+        self.assertEqual(comb_mod(10**18, 10**9, 10**9+7), 0)
+        self.assertEqual(comb_mod(10**18, 10**18 - 5, 10**6), math.prod(range(10**18 - 4, 10**18 + 1)) // 120 % 10**6)
+        self.assertEqual(comb_mod(123456789012, 7, 5**12), math.comb(123456789012, 7) % 5**12)
+        self.assertEqual(comb_mod(123456789012, 123456789012 - 30, 2**3 * 5**12), math.comb(123456789012, 30) % (2**3 * 5**12))
+        for k in range(0, 60): self.assertEqual(comb_mod_prime_power(10**15, k, 1009, 3), math.comb(10**15, k) % 1009**3, f"testing comb(10^15, {k}) mod 1009^3")
+
 class TestChineseMod(unittest.TestCase):
     def test_common(self):
         self.assertEqual(chinese_mod((2, 7)), 2)
@@ -135,4 +167,55 @@ class TestZMod(unittest.TestCase):
         l = [1, 2, 3, 4, 5]
         i = ZMod(3, len(l))
 
-        self.assertEqual(l[i], 4)
\ No newline at end of file
+        self.assertEqual(l[i], 4)
+
+class TestZModContext(unittest.TestCase):
+    def test_scalar(self):
+        Z = ZModContext(7)
+        self.assertEqual(Z.add(5, 4), 2)
+        self.assertEqual(Z.sub(1, 3), 5)
+        self.assertEqual(Z.mul(3, 5), 1)
+        self.assertEqual(Z.neg(3), 4)
+        self.assertEqual(Z.pow(3, 6), 1)
+        self.assertEqual(Z.inv(3), 5)
+        self.assertEqual(Z.inv(10), 5)
+        self.assertEqual(Z.div(1, 3), 5)
+
+    def test_many(self):
+        m = 998244353
+        Z = ZModContext(m)
+        xs = [random.randrange(m) for _ in range(100)]
+        ys = [random.randrange(1, m) for _ in range(100)]
+        self.assertListEqual(Z.add_many(xs, ys), [(x+y) % m for (x, y) in zip(xs, ys)])
+        self.assertListEqual(Z.sub_many(xs, ys), [(x-y) % m for (x, y) in zip(xs, ys)])
+        self.assertListEqual(Z.mul_many(xs, ys), [x*y % m for (x, y) in zip(xs, ys)])
+        self.assertListEqual(Z.scale_many(xs, 3), [x*3 % m for x in xs])
+        self.assertListEqual(Z.inv_many(ys), [pow(y, -1, m) for y in ys])
+        self.assertEqual(Z.dot(xs, ys), sum(x*y for (x, y) in zip(xs, ys)) % m)
+        self.assertEqual(Z.sum(xs), sum(xs) % m)
+
+class TestZModArray(unittest.TestCase):
+    def test(self):
+        a, b = ZModContext(7).array([1, 2, 3, 10]), ZModArray([6, 6, 6, 6], 7)
+        self.assertListEqual(a.data, [1, 2, 3, 3])
+        self.assertEqual(a + b, [0, 1, 2, 2])
+        self.assertEqual(a - b, [2, 3, 4, 4])
+        self.assertEqual(a * b, [6, 5, 4, 4])
+        self.assertEqual(-a, [6, 5, 4, 4])
+        self.assertEqual(2 * a, [2, 4, 6, 6])
+        self.assertEqual(10 - a, [2, 1, 0, 0])
+        self.assertEqual(a + [1, 1, 1, 1], [2, 3, 4, 4])
+        self.assertEqual(a.dot(b), 5)
+        self.assertEqual(a.sum(), 2)
+        self.assertEqual(a[1:], [2, 3, 3])
+        self.assertEqual(a[0], 1)
+
+        a += 1
+        self.assertEqual(a, [2, 3, 4, 4])
+        a *= b
+        self.assertEqual(a, [5, 4, 3, 3])
+        a[0] = 8
+        self.assertEqual(a[0], 1)
+
+    def test_mismatch(self):
+        with self.assertRaises(ValueError): ZModArray([1], 7) + ZModArray([1], 5)
\ No newline at end of file
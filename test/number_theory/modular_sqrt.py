@@ -1,7 +1,7 @@
 import unittest
 from ckp.number_theory.modular_sqrt import *
 
-from ckp.number_theory import is_prime, factor
+from ckp.number_theory import is_prime, factor, legendre_symbol
 
 class TestSqrtModPrime(unittest.TestCase):
     def test(self):
@@ -16,6 +16,32 @@ class TestSqrtModPrime(unittest.TestCase):
                 else:
                     self.assertEqual(pow(a_sqrt, 2, p), a, f"sqrt_mod_prime({a}, {p}) returned {a_sqrt}, which is wrong.")
 
+class TestSqrtModPrimeAlgorithms(unittest.TestCase):
+    def check(self, n, p, x):
+        if n % p and legendre_symbol(n, p) == 1: self.assertEqual(x*x % p, n % p, f"Wrong square root {x} of {n} for mod {p}")
+        else: self.assertEqual(x, 0, f"There shouldn't be any square root of {n} for mod {p}")
+
+    def test_small(self):
+        for p in range(3, 200):
+            if not is_prime(p): continue
+            for n in range(-p, 2*p):
+                self.check(n, p, sqrt_mod_prime_cipolla(n, p))
+                self.check(n, p, sqrt_mod_prime_tonelli_shanks(n, p))
+
+    def test_large(self):
+        # 998244353 and 3*2^30+1 have p-1 divisible by a large power of two.
+        for p in [998244353, 10**9+7, 3*2**30+1, 5*2**25+1, 2**61-1, 2**127-1]:
+            for n in [1, 2, 3, 5, p-1, p-2, 12345678901234567890, 3**100]:
+                self.check(n, p, sqrt_mod_prime(n, p))
+                self.check(n, p, sqrt_mod_prime_cipolla(n, p))
+                self.check(n, p, sqrt_mod_prime_tonelli_shanks(n, p))
+
+    def test_many(self):
+        for p in [2, 3, 5, 7, 13, 17, 97, 998244353, 10**9+7, 3*2**30+1]:
+            ns = list(range(-5, 100)) + [p-1, p, p+1, 10**18+9]
+            self.assertEqual(sqrt_mod_prime_many(ns, p), [sqrt_mod_prime(n, p) for n in ns])
+        self.assertEqual(sqrt_mod_prime_many([], 998244353), [])
+
 class TestSqrtModPrimePower(unittest.TestCase):
     def test(self):
         for p in range(2, 100):
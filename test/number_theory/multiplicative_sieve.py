@@ -0,0 +1,25 @@
+import unittest
+from ckp.number_theory.multiplicative_sieve import *
+
+from ckp.number_theory import euler_phi, num_divisors, sum_divisors, mobius_naive, factor
+
+class TestMultiplicativeSieve(unittest.TestCase):
+    def test_presets(self):
+        N = 3000
+        for (f_prime_power, f_naive) in ((multiplicative_phi, euler_phi), (multiplicative_mu, mobius_naive), (multiplicative_num_divisors, num_divisors), (multiplicative_sum_divisors, sum_divisors)):
+            f, _ = multiplicative_sieve(N, f_prime_power)
+            self.assertEqual(len(f), N+1)
+            for n in range(1, N+1): self.assertEqual(f[n], f_naive(n), f"testing {f_prime_power.__name__}({n})")
+
+    def test_custom(self):
+        # Number of distinct prime factors is additive, so 2^omega(n) is multiplicative.
+        f, _ = multiplicative_sieve(1000, lambda p, k: 2)
+        for n in range(1, 1001): self.assertEqual(f[n], 2**len(set(factor(n))), f"testing {n=}")
+
+    def test_small(self):
+        self.assertEqual(multiplicative_sieve(0, multiplicative_phi), ([0], [0]))
+        self.assertEqual(multiplicative_sieve(1, multiplicative_phi), ([0, 1], [0, 1]))
+
+    def test_factor(self):
+        _, spf = multiplicative_sieve(10000, multiplicative_mu)
+        for n in range(1, 10001): self.assertListEqual(list(multiplicative_sieve_factor(spf, n)), sorted(factor(n)), f"factoring {n=}")
@@ -0,0 +1,35 @@
+import unittest
+from ckp.number_theory.multiplicative_sum import *
+
+import itertools
+from ckp.number_theory.multiplicative_sieve import *
+
+class TestMultiplicativePrefixSum(unittest.TestCase):
+    def test_presets(self):
+        N = 2000
+        for (f_p, f_pk) in (([-1, 1], multiplicative_phi), ([-1], multiplicative_mu), ([2], multiplicative_num_divisors), ([1, 1], multiplicative_sum_divisors)):
+            f, _ = multiplicative_sieve(N, f_pk)
+            prefix = list(itertools.accumulate(f))
+            for n in list(range(0, 200)) + [1999, 2000]:
+                self.assertEqual(multiplicative_prefix_sum(n, f_p, f_pk), prefix[n], f"testing {f_pk.__name__} for {n=}")
+
+    def test_large(self):
+        self.assertEqual(multiplicative_prefix_sum(10**7, [-1, 1], multiplicative_phi), 30396356427242)
+
+class TestMertensTotientSum(unittest.TestCase):
+    def test_small(self):
+        N = 10**5
+        mu, _ = multiplicative_sieve(N, multiplicative_mu)
+        phi, _ = multiplicative_sieve(N, multiplicative_phi)
+        M, Phi = list(itertools.accumulate(mu)), list(itertools.accumulate(phi))
+        for n in list(range(0, 300)) + [10**4, 54321, 10**5]:
+            self.assertEqual(mertens(n), M[n], f"testing mertens({n})")
+            self.assertEqual(totient_sum(n), Phi[n], f"testing totient_sum({n})")
+        for n in (1000, 54321, 10**5):
+            for lim in (317, 1000):
+                self.assertEqual(dirichlet_hyperbola_sum(n, M[:lim], lambda v: 1), M[n])
+                self.assertEqual(dirichlet_hyperbola_sum(n, Phi[:lim], lambda v: v*(v+1)//2), Phi[n])
+
+    def test_large(self):
+        self.assertEqual(mertens(10**9), -222)
+        self.assertEqual(totient_sum(10**8), 3039635516365908)
@@ -58,3 +58,23 @@ class TestIsPrime(unittest.TestCase):
                 prod *= p
                 if prod != p:
                     self.assertFalse(is_prime(prod), f"{prod} is not a prime number")
+
+class TestIsPrimeMany(unittest.TestCase):
+    def test_small(self):
+        ns = list(range(-100, 70000))
+        self.assertEqual(list(is_prime_many(ns)), [int(is_prime_trial_division(n)) for n in ns])
+
+    def test_empty(self):
+        self.assertEqual(is_prime_many([]), bytearray())
+
+    def test_pseudoprimes(self):
+        # Strong pseudoprimes to base 2, and to every prime base up to 23 and 37.
+        ns = [2047, 3277, 4033, 4681, 8321, 3825123056546413051, 318665857834031151167461, 3317044064679887385961981]
+        self.assertEqual(is_prime_many(ns), bytearray(len(ns)))
+
+    def test_large(self):
+        ns = [1_000_000_009, 205119501451619, 2**61-1, 2**64-59, 2**64+13, 10**100+267, 10**18+3, 10**18+9]
+        ns += [p*q for p in (1_000_003, 4_294_967_311, 2**31-1) for q in (1_000_033, 4_294_967_357, 2**61-1)]
+        ns += list(range(10**18, 10**18+2000))
+        self.assertEqual(list(is_prime_many(ns)), [int(is_prime(n)) for n in ns])
+
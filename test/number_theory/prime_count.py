@@ -0,0 +1,40 @@
+import unittest
+from ckp.number_theory.prime_count import *
+
+from ckp.number_theory.prime_sieve import prime_sieve_segmented
+
+class TestPowerSum(unittest.TestCase):
+    def test(self):
+        for k in range(8):
+            for v in range(30): self.assertEqual(power_sum(v, k), sum(i**k for i in range(1, v+1)), f"testing {v=} {k=}")
+
+class TestPrimeCount(unittest.TestCase):
+    def test_small(self):
+        primes = prime_sieve_segmented(0, 3001)
+        for n in list(range(-2, 300)) + [1000, 2999, 3000]:
+            expected = sum(1 for p in primes if p <= n)
+            self.assertEqual(prime_count(n), expected, f"testing {n=}")
+            self.assertEqual(prime_count_meissel_lehmer(n), expected, f"testing {n=}")
+
+    def test_large(self):
+        for (n, expected) in ((10**6, 78498), (10**7, 664579), (10**8, 5761455), (10**9, 50847534)):
+            self.assertEqual(prime_count(n), expected, f"testing {n=}")
+        self.assertEqual(prime_count_meissel_lehmer(10**6), 78498)
+        self.assertEqual(prime_sum_table(10**8, 0)[1][1], 5761455)
+
+class TestPrimeSum(unittest.TestCase):
+    def test_small(self):
+        primes = prime_sieve_segmented(0, 1001)
+        for n in list(range(0, 100)) + [999, 1000]:
+            for k in range(4): self.assertEqual(prime_sum(n, k), sum(p**k for p in primes if p <= n), f"testing {n=} {k=}")
+
+    def test_table(self):
+        n = 10**4
+        primes = prime_sieve_segmented(0, n+1)
+        small, large = prime_sum_table(n, 1)
+        for v in range(len(small)): self.assertEqual(small[v], sum(p for p in primes if p <= v))
+        for i in range(1, len(large)): self.assertEqual(large[i], sum(p for p in primes if p <= n//i))
+
+    def test_large(self):
+        self.assertEqual(prime_sum(2*10**6), 142913828922)
+        self.assertEqual(prime_sum(10**9), 24739512092254535)
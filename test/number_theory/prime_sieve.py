@@ -59,4 +59,40 @@ class TestPrimeSieve(unittest.TestCase):
         self.assertEqual(len(list(sieve.primes())), 664579)
 
         self.assertTrue(sieve.is_prime(10000019))
-        self.assertEqual(len(list(sieve.primes())), 664580)
\ No newline at end of file
+        self.assertEqual(len(list(sieve.primes())), 664580)
+
+class TestCompactPrimeSieve(unittest.TestCase):
+    def test_single_alloc(self):
+        sieve = CompactPrimeSieve(100000)
+        for n in range(-5, 10001): self.assertEqual(is_prime_trial_division(n), sieve.is_prime(n), f"primality test for {n=}")
+
+    def test_multi_extend(self):
+        sieve = CompactPrimeSieve()
+        sieve.extend(151)
+        sieve.extend(500)
+        sieve.extend(5001)
+        for n in range(100001): self.assertEqual(is_prime_trial_division(n), sieve.is_prime(n), f"primality test for {n=}")
+
+    def test_primes(self):
+        self.assertListEqual(list(CompactPrimeSieve(100).primes()), [n for n in range(100) if is_prime_trial_division(n)])
+        self.assertEqual(len(list(CompactPrimeSieve(10**6).primes())), 78498)
+
+class TestPrimeSieveSegmented(unittest.TestCase):
+    def test_small(self):
+        primes = [n for n in range(1000) if is_prime_trial_division(n)]
+        for L in range(0, 50):
+            for R in (L, L+1, 100, 999, 1000):
+                for block_size in (2, 5, 64, 1<<19):
+                    self.assertListEqual(prime_sieve_segmented(L, R, block_size), [p for p in primes if L <= p < R], f"{L=} {R=} {block_size=}")
+
+    def test_large(self):
+        L = 10**12
+        primes = prime_sieve_segmented(L, L+10000)
+        self.assertEqual(len(primes), 335)
+        self.assertTrue(all(map(is_prime, primes)))
+
+    def test_iter(self):
+        it = prime_sieve_segmented_iter(0, 10**6, 1000)
+        self.assertEqual(next(it), 2)
+        self.assertEqual(next(it), 3)
+        self.assertEqual(sum(1 for _ in it), 78496)
@@ -0,0 +1,4 @@
+from .__init__ import *
+import unittest
+
+unittest.main()
\ No newline at end of file
@@ -0,0 +1,39 @@
+import unittest
+from ckp.polynomial.linear_recurrence import *
+
+import random
+
+P = 998244353
+
+def extend_naive(coeffs, init, n, p = P):
+    a = init[:]
+    while len(a) < n: a.append(sum(c * a[-1-j] for (j, c) in enumerate(coeffs)) % p)
+    return a
+
+class TestBerlekampMassey(unittest.TestCase):
+    def test_fibonacci(self):
+        self.assertListEqual(berlekamp_massey([0, 1, 1, 2, 3, 5, 8, 13]), [1, 1])
+        self.assertListEqual(berlekamp_massey([0, 0, 0, 0]), [])
+
+    def test_random(self):
+        for k in (1, 2, 5, 50):
+            coeffs = [random.randrange(P) for _ in range(k)]
+            a = extend_naive(coeffs, [random.randrange(P) for _ in range(k)], 2*k+10)
+            self.assertListEqual(berlekamp_massey(a), coeffs)
+
+class TestLinearRecurrenceNth(unittest.TestCase):
+    def test_fibonacci(self):
+        self.assertEqual(linear_recurrence_nth([1, 1], [0, 1], 10), 55)
+        self.assertEqual(linear_recurrence_nth([1, 1], [0, 1], 10**18, 10**9+7), 209783453)
+
+    def test_random(self):
+        for k in (1, 2, 5, 50):
+            coeffs = [random.randrange(P) for _ in range(k)]
+            a = extend_naive(coeffs, [random.randrange(P) for _ in range(k)], 300)
+            for n in (0, k-1, k, k+1, 150, 299):
+                self.assertEqual(linear_recurrence_nth(coeffs, a[:k], n), a[n])
+
+    def test_roundtrip(self):
+        a = extend_naive([3, 0, 7], [1, 2, 3], 20)
+        coeffs = berlekamp_massey(a)
+        self.assertEqual(linear_recurrence_nth(coeffs, a[:len(coeffs)], 19), a[19])
@@ -0,0 +1,134 @@
+import unittest
+from ckp.polynomial.polynomial_mod import *
+
+import random
+from ckp.fourier.util import convolve_naive
+
+P = 998244353
+
+def mul_naive(a, b, p = P):
+    return [x%p for x in convolve_naive(a, b)]
+
+class TestPolyModMul(unittest.TestCase):
+    def test_random(self):
+        for p in (P, 10**9+7, 7):
+            for _ in range(20):
+                a = [random.randrange(p) for _ in range(random.randint(1, 100))]
+                b = [random.randrange(p) for _ in range(random.randint(1, 100))]
+                self.assertListEqual(poly_mod_mul(a, b, p), mul_naive(a, b, p))
+
+    def test_large(self):
+        a = [random.randrange(P) for _ in range(40000)]
+        b = [random.randrange(P) for _ in range(30000)]
+        c = poly_mod_mul(a, b)
+        self.assertEqual(len(c), 69999)
+        self.assertEqual(c[100], sum(a[i] * b[100-i] for i in range(101)) % P)
+
+class TestPolyModCalculus(unittest.TestCase):
+    def test(self):
+        self.assertListEqual(poly_mod_derivative([5, 1, 2, 3]), [1, 4, 9])
+        self.assertListEqual(poly_mod_integral([1, 4, 9]), [0, 1, 2, 3])
+        a = [random.randrange(P) for _ in range(50)]
+        self.assertListEqual(poly_mod_derivative(poly_mod_integral(a)), a)
+
+class TestPolyModInv(unittest.TestCase):
+    def test_random(self):
+        for p in (P, 10**9+7):
+            for n in (1, 2, 3, 10, 100):
+                a = [random.randrange(1, p)] + [random.randrange(p) for _ in range(random.randint(0, 120))]
+                g = poly_mod_inv(a, n, p)
+                self.assertEqual(len(g), n)
+                self.assertListEqual(mul_naive(a, g, p)[:n], [1] + [0] * (n-1))
+
+    def test_large(self):
+        n = 40000
+        a = [random.randrange(1, P) for _ in range(n)]
+        g = poly_mod_inv(a, n)
+        self.assertListEqual(poly_mod_mul(a, g)[:n], [1] + [0] * (n-1))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError): poly_mod_inv([0, 1], 3)
+
+class TestPolyModLogExp(unittest.TestCase):
+    def test_known(self):
+        # exp(x) = sum x^n / n!
+        e = poly_mod_exp([0, 1], 10)
+        f = 1
+        for i in range(10):
+            self.assertEqual(e[i] * f % P, 1)
+            f *= i+1
+        # log(1-x) = -sum x^n / n
+        l = poly_mod_log([1, P-1], 10)
+        self.assertEqual(l[0], 0)
+        for i in range(1, 10): self.assertEqual(l[i] * i % P, P-1)
+
+    def test_inverse(self):
+        for n in (1, 5, 64, 300):
+            a = [0] + [random.randrange(P) for _ in range(n)]
+            self.assertListEqual(poly_mod_log(poly_mod_exp(a, n), n), a[:n])
+
+class TestPolyModSqrt(unittest.TestCase):
+    def test_random(self):
+        for n in (1, 2, 10, 200):
+            for s in (0, 1, 3):
+                b = [0] * s + [random.randrange(1, P)] + [random.randrange(P) for _ in range(n)]
+                a = mul_naive(b, b)
+                g = poly_mod_sqrt(a, n)
+                self.assertEqual(len(g), n)
+                self.assertListEqual(mul_naive(g, g)[:n], a[:n])
+
+    def test_none(self):
+        self.assertIsNone(poly_mod_sqrt([0, 1], 5))
+        self.assertIsNone(poly_mod_sqrt([3, 1], 5))
+        self.assertListEqual(poly_mod_sqrt([0, 0, 0], 3), [0, 0, 0])
+
+class TestPolyModPow(unittest.TestCase):
+    def test_random(self):
+        for n in (1, 7, 50):
+            for k in (0, 1, 2, 5, 13):
+                for s in (0, 1, 2):
+                    a = [0] * s + [random.randrange(1, P) for _ in range(random.randint(1, n))]
+                    expected = [1]
+                    for _ in range(k): expected = mul_naive(expected, a)[:n]
+                    expected += [0] * (n - len(expected))
+                    self.assertListEqual(poly_mod_pow(a, k, n), expected, f"{n=}, {k=}, {s=}")
+
+    def test_large_exponent(self):
+        a = [1, 1]
+        k = 10**18
+        g = poly_mod_pow(a, k, 5)
+        self.assertListEqual(g, [1] + [comb % P for comb in (k, k*(k-1)//2, k*(k-1)*(k-2)//6, k*(k-1)*(k-2)*(k-3)//24)])
+
+def eval_naive(a, x, p = P):
+    v = 0
+    for c in reversed(a): v = (v*x + c) % p
+    return v
+
+class TestPolyModDivmod(unittest.TestCase):
+    def test_random(self):
+        for (n, m) in ((5, 3), (10, 20), (300, 100), (300, 200), (1000, 1)):
+            a = [random.randrange(P) for _ in range(n)]
+            b = [random.randrange(P) for _ in range(m-1)] + [random.randrange(1, P)]
+            q, r = poly_mod_divmod(a, b)
+            self.assertEqual(len(r), min(n, m-1))
+            bq = mul_naive(b, q) if q else []
+            self.assertListEqual([(x+y)%P for (x, y) in zip(bq + [0]*n, r + [0]*n)][:n], a)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError): poly_mod_divmod([1, 2, 3], [1, 0])
+
+class TestPolyModMultipoint(unittest.TestCase):
+    def test_evaluate(self):
+        for n in (1, 2, 3, 100, 1000):
+            xs = [random.randrange(P) for _ in range(n)]
+            a = [random.randrange(P) for _ in range(random.randint(1, 2*n))]
+            self.assertListEqual(poly_mod_multipoint_evaluate(a, xs), [eval_naive(a, x) for x in xs])
+
+    def test_interpolate(self):
+        for n in (1, 2, 3, 100, 1000):
+            xs = random.sample(range(P), n)
+            ys = [random.randrange(P) for _ in range(n)]
+            tree = poly_mod_subproduct_tree(xs)
+            a = poly_mod_interpolate(xs, ys, tree=tree)
+            self.assertEqual(len(a), n)
+            self.assertListEqual(poly_mod_multipoint_evaluate(a, xs, tree=tree), ys)